@@ -26,6 +26,7 @@ BUTTON_COLOR = rgb565(70, 130, 180)
 BUTTON_PRESSED_COLOR = rgb565(100, 160, 210)
 TEXT_COLOR = rgb565(255, 255, 255)
 BORDER_COLOR = rgb565(200, 200, 200)
+SHADOW_COLOR = rgb565(0, 0, 0)
 
 # Font configuration for native text rendering
 FONT_16x16 = 1  # Built-in 16×16 Liberation Sans font
@@ -46,7 +47,7 @@ def draw_text(display, text, x, y, color, font_id=FONT_16x16, shadow=True):
     display.set_font(font_id)
     if shadow:
         # Draw shadow (black text offset by 2 pixels)
-        display.text(x + 2, y + 2, text, color=rgb565(0, 0, 0))
+        display.text(x + 2, y + 2, text, color=SHADOW_COLOR)
     # Draw main text
     display.text(x, y, text, color=color)
 
@@ -108,7 +108,7 @@ def draw_text(display, text, x, y, color, font_id=FONT_HUD, shadow=True):
     display.set_font(font_id)
     if shadow:
         # Draw shadow (black text offset by 2 pixels)
-        display.text(x + 2, y + 2, text, color=rgb565(0, 0, 0))
+        display.text(x + 2, y + 2, text, color=HUD_SHADOW)
     # Draw main text
     display.text(x, y, text, color=color)
 
@@ -48,6 +48,26 @@ lvgl.init_touch(i2c)
 
 print("Display and touch initialized successfully!")
 
+# ============================================================================
+# SHARED BUTTON GEOMETRY
+# ============================================================================
+
+# Each button group shares one size definition. rm690b0_lvgl has no Style
+# object yet, so make_button() applies the shared size to every widget.
+NAV_BTN_SIZE = (150, 70)
+MEDIA_BTN_SIZE = (80, 80)
+FILE_BTN_SIZE = (120, 60)
+
+
+def make_button(text, x, y, size):
+    """Create a button at (x, y) using one of the shared sizes."""
+    btn = rm690b0_lvgl.Button(text=text)
+    btn.x = x
+    btn.y = y
+    btn.width, btn.height = size
+    return btn
+
+
 # ============================================================================
 # STATUS BAR WITH ICONS
 # ============================================================================
@@ -79,25 +99,13 @@ battery_text.set_text_color(0xFFFFFF)
 print("Creating navigation buttons...")
 
 # Home button
-home_btn = rm690b0_lvgl.Button(text=f"{SYMBOL_HOME} Home")
-home_btn.x = 50
-home_btn.y = 80
-home_btn.width = 150
-home_btn.height = 70
+home_btn = make_button(f"{SYMBOL_HOME} Home", 50, 80, NAV_BTN_SIZE)
 
 # Settings button
-settings_btn = rm690b0_lvgl.Button(text=f"{SYMBOL_SETTINGS} Settings")
-settings_btn.x = 225
-settings_btn.y = 80
-settings_btn.width = 150
-settings_btn.height = 70
+settings_btn = make_button(f"{SYMBOL_SETTINGS} Settings", 225, 80, NAV_BTN_SIZE)
 
 # Power button
-power_btn = rm690b0_lvgl.Button(text=f"{SYMBOL_POWER} Power")
-power_btn.x = 400
-power_btn.y = 80
-power_btn.width = 150
-power_btn.height = 70
+power_btn = make_button(f"{SYMBOL_POWER} Power", 400, 80, NAV_BTN_SIZE)
 power_btn.set_style_bg_color(0xFF0000)  # Red background
 
 # ============================================================================
@@ -107,34 +115,18 @@ power_btn.set_style_bg_color(0xFF0000)  # Red background
 print("Creating media control buttons...")
 
 # Previous button
-prev_btn = rm690b0_lvgl.Button(text=SYMBOL_PREV)
-prev_btn.x = 100
-prev_btn.y = 180
-prev_btn.width = 80
-prev_btn.height = 80
+prev_btn = make_button(SYMBOL_PREV, 100, 180, MEDIA_BTN_SIZE)
 
 # Play/Pause button
-play_pause_btn = rm690b0_lvgl.Button(text=SYMBOL_PLAY)
-play_pause_btn.x = 200
-play_pause_btn.y = 180
-play_pause_btn.width = 80
-play_pause_btn.height = 80
+play_pause_btn = make_button(SYMBOL_PLAY, 200, 180, MEDIA_BTN_SIZE)
 play_pause_btn.set_style_bg_color(0x00AA00)  # Green
 
 # Stop button
-stop_btn = rm690b0_lvgl.Button(text=SYMBOL_STOP)
-stop_btn.x = 300
-stop_btn.y = 180
-stop_btn.width = 80
-stop_btn.height = 80
+stop_btn = make_button(SYMBOL_STOP, 300, 180, MEDIA_BTN_SIZE)
 stop_btn.set_style_bg_color(0xAA0000)  # Dark red
 
 # Next button
-next_btn = rm690b0_lvgl.Button(text=SYMBOL_NEXT)
-next_btn.x = 400
-next_btn.y = 180
-next_btn.width = 80
-next_btn.height = 80
+next_btn = make_button(SYMBOL_NEXT, 400, 180, MEDIA_BTN_SIZE)
 
 # Volume label
 volume_label = rm690b0_lvgl.Label(text=f"{SYMBOL_VOLUME_MAX} Volume")
@@ -148,33 +140,17 @@ volume_label.y = 280
 print("Creating file operation buttons...")
 
 # Save button
-save_btn = rm690b0_lvgl.Button(text=f"{SYMBOL_SAVE} Save")
-save_btn.x = 50
-save_btn.y = 320
-save_btn.width = 120
-save_btn.height = 60
+save_btn = make_button(f"{SYMBOL_SAVE} Save", 50, 320, FILE_BTN_SIZE)
 
 # Edit button
-edit_btn = rm690b0_lvgl.Button(text=f"{SYMBOL_EDIT} Edit")
-edit_btn.x = 190
-edit_btn.y = 320
-edit_btn.width = 120
-edit_btn.height = 60
+edit_btn = make_button(f"{SYMBOL_EDIT} Edit", 190, 320, FILE_BTN_SIZE)
 
 # Trash button
-trash_btn = rm690b0_lvgl.Button(text=f"{SYMBOL_TRASH} Delete")
-trash_btn.x = 330
-trash_btn.y = 320
-trash_btn.width = 120
-trash_btn.height = 60
+trash_btn = make_button(f"{SYMBOL_TRASH} Delete", 330, 320, FILE_BTN_SIZE)
 trash_btn.set_style_bg_color(0xCC0000)  # Red
 
 # Download button
-download_btn = rm690b0_lvgl.Button(text=f"{SYMBOL_DOWNLOAD} Download")
-download_btn.x = 470
-download_btn.y = 320
-download_btn.width = 120
-download_btn.height = 60
+download_btn = make_button(f"{SYMBOL_DOWNLOAD} Download", 470, 320, FILE_BTN_SIZE)
 
 # ============================================================================
 # STATUS LABEL
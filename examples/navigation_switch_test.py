@@ -61,6 +61,40 @@ LED_CYAN = 0b011
 LED_MAGENTA = 0b101
 LED_WHITE = 0b111
 
+# Mask covering the five switch input pins (0-4)
+SWITCH_MASK = 0b00011111
+
+I2C_LOCK_TIMEOUT = 1.0  # seconds
+
+
+def _build_direction_table():
+    """Map every pressed-switch bitmask (bits 0-4) to its direction string."""
+    order = (
+        (PIN_UP, "UP"),
+        (PIN_DOWN, "DOWN"),
+        (PIN_LEFT, "LEFT"),
+        (PIN_RIGHT, "RIGHT"),
+        (PIN_CENTER, "CENTER"),
+    )
+    table = []
+    for pressed in range(SWITCH_MASK + 1):
+        names = [name for pin, name in order if pressed & (1 << pin)]
+        table.append("-".join(names) if names else "NONE")
+    return tuple(table)
+
+
+# Direction strings are interned once at import; decoding is a tuple index
+_DIR_TABLE = _build_direction_table()
+
+
+def lock_i2c(i2c, timeout=I2C_LOCK_TIMEOUT):
+    """Acquire the I2C bus lock, yielding between attempts."""
+    start = time.monotonic()
+    while not i2c.try_lock():
+        if time.monotonic() - start > timeout:
+            raise RuntimeError("I2C bus lock timeout")
+        time.sleep(0)
+
 
 class PCA9554:
     """Driver for PCA9554 8-bit I2C I/O expander."""
@@ -70,20 +104,17 @@ class PCA9554:
         self.i2c = i2c
         self.address = address
 
-        # Verify device is present
+        # Verify device is present and seed the output shadow register.
+        # All later output writes go through the shadow, so the only I2C
+        # reads in steady state are input-port reads.
         try:
-            self._read_register(REG_INPUT_PORT)
+            self._output_shadow = self._read_register(REG_OUTPUT_PORT)
         except Exception as e:
             raise RuntimeError(f"PCA9554 not found at 0x{address:02X}: {e}")
 
     def _read_register(self, register):
         """Read a single byte from a register."""
-        timeout = 1.0  # 1 second timeout
-        start = time.monotonic()
-        while not self.i2c.try_lock():
-            if time.monotonic() - start > timeout:
-                raise RuntimeError("I2C bus lock timeout")
-            time.sleep(0.001)
+        lock_i2c(self.i2c)
         try:
             result = bytearray(1)
             self.i2c.writeto_then_readfrom(self.address, bytes([register]), result)
@@ -97,8 +128,7 @@ class PCA9554:
 
     def _write_register(self, register, value):
         """Write a single byte to a register."""
-        while not self.i2c.try_lock():
-            pass
+        lock_i2c(self.i2c)
         try:
             self.i2c.writeto(self.address, bytes([register, value]))
         finally:
@@ -129,11 +159,11 @@ class PCA9554:
         Args:
             value: 8-bit value to write (only bits 5-7 will be written)
         """
-        # Read current state first to preserve input pin bits
-        current = self._read_register(REG_OUTPUT_PORT)
         # Only modify output pins (bits 5-7), preserve input pins (bits 0-4)
-        new_value = (current & 0b00011111) | (value & 0b11100000)
-        self._write_register(REG_OUTPUT_PORT, new_value)
+        self._output_shadow = (self._output_shadow & 0b00011111) | (
+            value & 0b11100000
+        )
+        self._write_register(REG_OUTPUT_PORT, self._output_shadow)
 
     def read_pin(self, pin):
         """
@@ -156,12 +186,11 @@ class PCA9554:
             pin: Pin number (0-7)
             state: True for high, False for low
         """
-        current = self._read_register(REG_OUTPUT_PORT)
         if state:
-            new_value = current | (1 << pin)
+            self._output_shadow |= 1 << pin
         else:
-            new_value = current & ~(1 << pin)
-        self.write_outputs(new_value)
+            self._output_shadow &= ~(1 << pin)
+        self._write_register(REG_OUTPUT_PORT, self._output_shadow)
 
 
 class NavigationSwitch:
@@ -265,24 +294,9 @@ class NavigationSwitch:
         Returns:
             str: Direction like "UP", "DOWN-LEFT", "CENTER", etc.
         """
-        switches = self.read_switches()
-
-        directions = []
-        if switches["up"]:
-            directions.append("UP")
-        if switches["down"]:
-            directions.append("DOWN")
-        if switches["left"]:
-            directions.append("LEFT")
-        if switches["right"]:
-            directions.append("RIGHT")
-        if switches["center"]:
-            directions.append("CENTER")
-
-        if not directions:
-            return "NONE"
-
-        return "-".join(directions)
+        # Switches are active LOW, so invert before indexing the table
+        value = self.pca.read_inputs()
+        return _DIR_TABLE[~value & SWITCH_MASK]
 
     def wait_for_press(self, timeout=None):
         """
@@ -382,9 +396,6 @@ def main():
     print("\nPress Ctrl+C to exit")
     print("-" * 70)
 
-    last_direction = "NONE"
-    last_switches = nav.read_switches()
-
     # Color mapping for each direction
     direction_colors = {
         "UP": LED_RED,
@@ -399,17 +410,29 @@ def main():
         "NONE": LED_OFF,
     }
 
+    # Status line fields, in display order
+    status_fields = (
+        ("UP", PIN_UP),
+        ("DOWN", PIN_DOWN),
+        ("LEFT", PIN_LEFT),
+        ("RIGHT", PIN_RIGHT),
+        ("CENTER", PIN_CENTER),
+    )
+
     try:
         while True:
             try:
-                switches = nav.read_switches()
-                direction = nav.get_direction_string()
+                # One I2C read per pass; the direction and the status line are
+                # both decoded from the same bits (switches are active LOW)
+                pressed = ~nav.pca.read_inputs() & SWITCH_MASK
             except RuntimeError as e:
                 print(f"\n⚠️  I2C Error: {e}")
                 print("Retrying in 1 second...")
                 time.sleep(1)
                 continue
 
+            direction = _DIR_TABLE[pressed]
+
             # Update LED based on direction
             led_color = direction_colors.get(direction, LED_OFF)
             nav.set_led(led_color)
@@ -417,18 +440,12 @@ def main():
             # Print state (update line in place)
             status = " | ".join(
                 [
-                    f"UP: {'X' if switches['up'] else ' '}",
-                    f"DOWN: {'X' if switches['down'] else ' '}",
-                    f"LEFT: {'X' if switches['left'] else ' '}",
-                    f"RIGHT: {'X' if switches['right'] else ' '}",
-                    f"CENTER: {'X' if switches['center'] else ' '}",
+                    f"{name}: {'X' if pressed & (1 << pin) else ' '}"
+                    for name, pin in status_fields
                 ]
             )
             print(f"\r{status} | {direction:15s}", end="")
 
-            last_direction = direction
-            last_switches = switches.copy()
-
             time.sleep(0.05)  # 20 Hz update rate for responsive LED feedback
 
     except KeyboardInterrupt:
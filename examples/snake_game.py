@@ -22,11 +22,17 @@ Controls:
 
 import random
 import time
+from collections import deque
 
 import board
 import busio
 import rm690b0
 
+try:
+    import asyncio
+except ImportError:
+    asyncio = None
+
 # Import the Navigation Switch driver
 # We'll use a simplified version inline to avoid external dependencies
 PCA9554_ADDR = 0x21
@@ -40,6 +46,16 @@ PIN_RIGHT = 2
 PIN_LEFT = 3
 PIN_CENTER = 4
 
+# Switch bit masks (active-low on the port; set in read_switches_raw())
+SWITCH_UP = 1 << PIN_UP
+SWITCH_DOWN = 1 << PIN_DOWN
+SWITCH_RIGHT = 1 << PIN_RIGHT
+SWITCH_LEFT = 1 << PIN_LEFT
+SWITCH_CENTER = 1 << PIN_CENTER
+SWITCH_MASK = 0b00011111
+
+I2C_LOCK_TIMEOUT = 1.0  # seconds
+
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
@@ -59,8 +75,27 @@ CHAR_HEIGHT_HUD = 16
 CHAR_WIDTH_TITLE = 24
 CHAR_HEIGHT_TITLE = 24
 HUD_MARGIN = 12
+SHADOW_HUD = False  # In-game HUD skips the shadow pass (title screens keep it)
+DEBUG_HUD = False  # Print a status line once per second during play
 
 WAIT_POLL_INTERVAL = 0.02
+INPUT_POLL_INTERVAL = 0.02  # Joystick polling task period (50 Hz)
+
+# Frame pacing: sleep until this close to the deadline, then busy-wait
+NS_PER_SECOND = 1000 * 1000 * 1000
+FRAME_SPIN_NS = 2 * 1000 * 1000
+
+CELL_INNER = GRID_SIZE - 2  # Snake segment size inside the grid lines
+FOOD_INNER = GRID_SIZE - 4
+
+# HUD text blocks ("SCORE"/"BEST" label + value, incl. 2 px shadow)
+HUD_BOX_CHARS = 6
+HUD_BOX_W = HUD_BOX_CHARS * CHAR_WIDTH_HUD + 2
+HUD_BOX_H = 22 + CHAR_HEIGHT_HUD + 2
+
+# Repaint the full frame instead when a single frame's incremental update
+# would touch more than this many pixels
+FULL_REDRAW_AREA = (GRID_COLS * GRID_SIZE) * (GRID_ROWS * GRID_SIZE) // 2
 
 # ---------------------------------------------------------------------------
 # Colors
@@ -81,6 +116,13 @@ WALL_COLOR = rgb565(100, 100, 100)  # Gray walls
 HUD_COLOR = rm690b0.WHITE
 OVERLAY_BG = rgb565(20, 25, 35)
 OVERLAY_BORDER = rgb565(255, 255, 0)
+SHADOW_COLOR = rgb565(0, 0, 0)
+
+
+def rgb565_bytes(color: int) -> bytes:
+    """Encode one RGB565 color as the little-endian pixel bytes blit_buffer expects."""
+    return bytes((color & 0xFF, color >> 8))
+
 
 # Direction constants
 DIR_UP = (0, -1)
@@ -104,10 +146,14 @@ def text_pixel_width(text: str, font_id: int = FONT_HUD) -> int:
 
 
 def draw_text(display, text, x, y, color, font_id=FONT_HUD, shadow=True):
-    """Draw text using native built-in font with optional shadow effect."""
-    display.set_font(font_id)
+    """Draw text using native built-in font with optional shadow effect.
+
+    Pass ``font_id=None`` to keep the font already selected on the display.
+    """
+    if font_id is not None:
+        display.set_font(font_id)
     if shadow:
-        display.text(x + 2, y + 2, text, color=rgb565(0, 0, 0))
+        display.text(x + 2, y + 2, text, color=SHADOW_COLOR)
     display.text(x, y, text, color=color)
 
 
@@ -116,6 +162,15 @@ def draw_text(display, text, x, y, color, font_id=FONT_HUD, shadow=True):
 # ---------------------------------------------------------------------------
 
 
+def lock_i2c(i2c, timeout=I2C_LOCK_TIMEOUT):
+    """Acquire the I2C bus lock, yielding between attempts."""
+    start = time.monotonic()
+    while not i2c.try_lock():
+        if time.monotonic() - start > timeout:
+            raise RuntimeError("I2C bus lock timeout")
+        time.sleep(0)
+
+
 class PCA9554:
     """Minimal PCA9554 driver for Navigation Switch."""
 
@@ -128,12 +183,7 @@ class PCA9554:
             raise RuntimeError(f"PCA9554 not found at 0x{address:02X}: {e}")
 
     def _read_register(self, register):
-        timeout = 1.0
-        start = time.monotonic()
-        while not self.i2c.try_lock():
-            if time.monotonic() - start > timeout:
-                raise RuntimeError("I2C bus lock timeout")
-            time.sleep(0.001)
+        lock_i2c(self.i2c)
         try:
             result = bytearray(1)
             self.i2c.writeto_then_readfrom(self.address, bytes([register]), result)
@@ -142,8 +192,7 @@ class PCA9554:
             self.i2c.unlock()
 
     def _write_register(self, register, value):
-        while not self.i2c.try_lock():
-            pass
+        lock_i2c(self.i2c)
         try:
             self.i2c.writeto(self.address, bytes([register, value]))
         finally:
@@ -169,46 +218,48 @@ class JoystickInput:
         self.pca.configure_pins(0b00011111)
         # Turn off LED
         self.pca.write_outputs(0b11100000)
-        self._last_state = {}
-
-    def read_switches(self):
-        """Read all switch states."""
-        value = self.pca.read_inputs()
-        return {
-            "up": not bool(value & (1 << PIN_UP)),
-            "down": not bool(value & (1 << PIN_DOWN)),
-            "left": not bool(value & (1 << PIN_LEFT)),
-            "right": not bool(value & (1 << PIN_RIGHT)),
-            "center": not bool(value & (1 << PIN_CENTER)),
-        }
+        self._last_center = 0
+        self._cached_value = None
+
+    def poll(self):
+        """Read the switch port once; later queries decode this cached value."""
+        self._cached_value = self.pca.read_inputs()
+        return self.read_switches_raw()
+
+    def read_switches_raw(self):
+        """Return the switches pressed at the last poll() as SWITCH_* bits."""
+        value = self._cached_value
+        if value is None:
+            raise RuntimeError("poll() must be called before reading switches")
+        return ~value & SWITCH_MASK
 
     def get_direction(self):
-        """Get current direction pressed (returns DIR_* constant or None)."""
-        switches = self.read_switches()
-        if switches["up"]:
+        """Get direction pressed at the last poll() (DIR_* constant or None)."""
+        bits = self.read_switches_raw()
+        if bits & SWITCH_UP:
             return DIR_UP
-        elif switches["down"]:
+        elif bits & SWITCH_DOWN:
             return DIR_DOWN
-        elif switches["left"]:
+        elif bits & SWITCH_LEFT:
             return DIR_LEFT
-        elif switches["right"]:
+        elif bits & SWITCH_RIGHT:
             return DIR_RIGHT
         return None
 
     def is_center_pressed(self):
-        """Check if center button is pressed (with debounce)."""
-        switches = self.read_switches()
-        pressed = switches["center"]
-        was_pressed = self._last_state.get("center", False)
-        self._last_state["center"] = pressed
-        return pressed and not was_pressed
-
-    def wait_for_center(self):
+        """Check if center was newly pressed at the last poll() (debounced)."""
+        pressed = self.read_switches_raw() & SWITCH_CENTER
+        was_pressed = self._last_center
+        self._last_center = pressed
+        return bool(pressed and not was_pressed)
+
+    async def wait_for_center(self):
         """Wait for center button press."""
         while True:
+            self.poll()
             if self.is_center_pressed():
                 return
-            time.sleep(WAIT_POLL_INTERVAL)
+            await asyncio.sleep(WAIT_POLL_INTERVAL)
 
     def deinit(self):
         try:
@@ -226,44 +277,62 @@ class Snake:
     """Snake entity."""
 
     def __init__(self, start_x, start_y):
-        self.segments = [
-            (start_x, start_y),
-            (start_x - 1, start_y),
-            (start_x - 2, start_y),
-        ]
+        # Head at the left end, tail at the right: both ends are O(1).
+        # Bounded by the grid size (+1 for the head added before the tail pops)
+        self.segments = deque((), GRID_COLS * GRID_ROWS + 1)
+        for i in range(3):
+            self.segments.append((start_x - i, start_y))
+        # Occupied cells mirrored in a set for O(1) collision/spawn checks
+        self.occupied = set(self.segments)
         self.direction = DIR_RIGHT
         self.next_direction = DIR_RIGHT
         self.grow_pending = 0
+        self._hit_self = False
 
     def set_direction(self, new_direction):
         """Set new direction (prevents 180-degree turns)."""
-        # Can't turn directly opposite
+        # Can't turn directly opposite (compared component-wise so no
+        # temporary tuple is allocated per tick)
         if (
-            new_direction[0] + self.direction[0],
-            new_direction[1] + self.direction[1],
-        ) == (0, 0):
+            new_direction[0] == -self.direction[0]
+            and new_direction[1] == -self.direction[1]
+        ):
             return
         self.next_direction = new_direction
 
     def move(self):
-        """Move snake one step forward."""
+        """Move snake one step forward.
+
+        Returns:
+            The vacated tail cell, or None if the snake grew this step.
+        """
         self.direction = self.next_direction
         head_x, head_y = self.segments[0]
         new_head = (head_x + self.direction[0], head_y + self.direction[1])
-        self.segments.insert(0, new_head)
+        growing = self.grow_pending > 0
 
-        if self.grow_pending > 0:
+        # The tail vacates its cell this step unless the snake is growing
+        self._hit_self = new_head in self.occupied and (
+            growing or new_head != self.segments[-1]
+        )
+        self.segments.appendleft(new_head)
+
+        if growing:
             self.grow_pending -= 1
-        else:
-            self.segments.pop()
+            self.occupied.add(new_head)
+            return None
+        tail = self.segments.pop()
+        self.occupied.discard(tail)
+        self.occupied.add(new_head)
+        return tail
 
     def grow(self):
         """Schedule snake to grow by one segment."""
         self.grow_pending += 1
 
     def collides_with_self(self):
-        """Check if head collides with body."""
-        return self.segments[0] in self.segments[1:]
+        """Check if head collides with body (evaluated by the last move)."""
+        return self._hit_self
 
     def collides_with_walls(self, cols, rows):
         """Check if head is outside boundaries."""
@@ -278,20 +347,19 @@ class Snake:
 class Food:
     """Food entity."""
 
-    def __init__(self, cols, rows, snake_segments):
-        self.position = self._spawn(cols, rows, snake_segments)
+    def __init__(self, cols, rows, occupied):
+        self.position = self._spawn(cols, rows, occupied)
 
-    def _spawn(self, cols, rows, snake_segments):
+    def _spawn(self, cols, rows, occupied):
         """Spawn food at random empty position."""
         while True:
-            x = random.randint(0, cols - 1)
-            y = random.randint(0, rows - 1)
-            if (x, y) not in snake_segments:
-                return (x, y)
+            cell = (random.randint(0, cols - 1), random.randint(0, rows - 1))
+            if cell not in occupied:
+                return cell
 
-    def respawn(self, cols, rows, snake_segments):
+    def respawn(self, cols, rows, occupied):
         """Respawn food at new location."""
-        self.position = self._spawn(cols, rows, snake_segments)
+        self.position = self._spawn(cols, rows, occupied)
 
 
 # ---------------------------------------------------------------------------
@@ -299,48 +367,65 @@ class Food:
 # ---------------------------------------------------------------------------
 
 
-def draw_grid(display, offset_x, offset_y):
-    """Draw subtle grid lines."""
-    for col in range(GRID_COLS + 1):
-        x = offset_x + col * GRID_SIZE
-        display.fill_rect(x, offset_y, 1, GRID_ROWS * GRID_SIZE, GRID_COLOR)
-    for row in range(GRID_ROWS + 1):
-        y = offset_y + row * GRID_SIZE
-        display.fill_rect(offset_x, y, GRID_COLS * GRID_SIZE, 1, GRID_COLOR)
+# Pre-rendered empty grid blocks keyed by (cols, rows)
+_grid_buffers = {}
 
 
-def draw_snake(display, snake, offset_x, offset_y):
+def grid_buffer(cols, rows):
+    """
+    Return a cols×rows block of empty grid cells as RGB565 pixel data.
+
+    Each cell carries its top and left grid line, so blocks tile seamlessly.
+    Buffers are built once and cached, since the grid never changes.
+    """
+    key = (cols, rows)
+    buf = _grid_buffers.get(key)
+    if buf is None:
+        line_px = rgb565_bytes(GRID_COLOR)
+        bg_px = rgb565_bytes(BG_COLOR)
+        line_row = line_px * (cols * GRID_SIZE)
+        cell_row = (line_px + bg_px * (GRID_SIZE - 1)) * cols
+        buf = bytearray(line_row + cell_row * (GRID_SIZE - 1)) * rows
+        _grid_buffers[key] = buf
+    return buf
+
+
+def draw_grid(display, layout):
+    """Draw the empty grid with a single buffer blit."""
+    x = layout.offset_x
+    y = layout.offset_y
+    grid_width = GRID_COLS * GRID_SIZE
+    grid_height = GRID_ROWS * GRID_SIZE
+    buf = grid_buffer(GRID_COLS, GRID_ROWS)
+    display.blit_buffer(x, y, grid_width, grid_height, buf)
+    # Closing lines on the right and bottom edges
+    display.fill_rect(x + grid_width, y, 1, grid_height, GRID_COLOR)
+    display.fill_rect(x, y + grid_height, grid_width + 1, 1, GRID_COLOR)
+
+
+def draw_cell(display, cell, color, layout):
+    """Fill the inside of one grid cell, leaving the grid lines intact."""
+    x, y = cell
+    display.fill_rect(
+        layout.col_px[x] + 1, layout.row_px[y] + 1, CELL_INNER, CELL_INNER, color
+    )
+
+
+def draw_snake(display, snake, layout):
     """Draw the snake."""
-    for i, (x, y) in enumerate(snake.segments):
-        px = offset_x + x * GRID_SIZE
-        py = offset_y + y * GRID_SIZE
-        color = SNAKE_HEAD_COLOR if i == 0 else SNAKE_BODY_COLOR
-        display.fill_rect(px + 1, py + 1, GRID_SIZE - 2, GRID_SIZE - 2, color)
-
-
-def draw_food(display, food, offset_x, offset_y):
-    """Draw the food."""
-    x, y = food.position
-    px = offset_x + x * GRID_SIZE
-    py = offset_y + y * GRID_SIZE
-    display.fill_rect(px + 2, py + 2, GRID_SIZE - 4, GRID_SIZE - 4, FOOD_COLOR)
-
-
-def draw_hud(display, score, best, width):
-    """Draw score HUD."""
-    label_x = HUD_MARGIN
-    label_y = HUD_MARGIN
-    draw_text(display, "SCORE", label_x, label_y, HUD_COLOR, font_id=FONT_HUD)
-    value = str(score)
-    draw_text(display, value, label_x, label_y + 22, HUD_COLOR, font_id=FONT_HUD)
-
-    best_label = "BEST"
-    best_value = str(best)
-    best_width = max(text_pixel_width(best_label), text_pixel_width(best_value))
-    right_margin = width - HUD_MARGIN - best_width
-    draw_text(display, best_label, right_margin, label_y, HUD_COLOR, font_id=FONT_HUD)
-    draw_text(
-        display, best_value, right_margin, label_y + 22, HUD_COLOR, font_id=FONT_HUD
+    col_px = layout.col_px
+    row_px = layout.row_px
+    color = SNAKE_HEAD_COLOR
+    for x, y in snake.segments:
+        display.fill_rect(col_px[x] + 1, row_px[y] + 1, CELL_INNER, CELL_INNER, color)
+        color = SNAKE_BODY_COLOR
+
+
+def draw_food(display, cell, layout):
+    """Draw the food in a grid cell."""
+    x, y = cell
+    display.fill_rect(
+        layout.col_px[x] + 2, layout.row_px[y] + 2, FOOD_INNER, FOOD_INNER, FOOD_COLOR
     )
 
 
@@ -418,22 +503,212 @@ def draw_game_over(display, score, best, width, height):
     )
 
 
-def draw_scene(display, snake, food, score, best):
+class GridLayout:
+    """Pixel geometry of the playfield, computed once per round."""
+
+    def __init__(self, width, height):
+        # Offsets that center the grid on screen
+        self.offset_x = (width - GRID_COLS * GRID_SIZE) // 2
+        self.offset_y = (height - GRID_ROWS * GRID_SIZE) // 2
+        # Top-left pixel of every column/row, so drawing is a tuple index
+        self.col_px = tuple(self.offset_x + c * GRID_SIZE for c in range(GRID_COLS))
+        self.row_px = tuple(self.offset_y + r * GRID_SIZE for r in range(GRID_ROWS))
+
+    def cell_range(self, x, y, w, h):
+        """Return the grid cells under a pixel box as an inclusive (c0, r0, c1, r1)."""
+        return (
+            max(0, (x - self.offset_x) // GRID_SIZE),
+            max(0, (y - self.offset_y) // GRID_SIZE),
+            min(GRID_COLS - 1, (x + w - 1 - self.offset_x) // GRID_SIZE),
+            min(GRID_ROWS - 1, (y + h - 1 - self.offset_y) // GRID_SIZE),
+        )
+
+
+def in_region(cell, region):
+    """Return True if a grid cell lies inside an inclusive cell range."""
+    x, y = cell
+    c0, r0, c1, r1 = region
+    return c0 <= x <= c1 and r0 <= y <= r1
+
+
+def restore_region(display, snake, food, region, layout):
+    """Repaint the grid, food and snake inside one cell range.
+
+    Returns:
+        int: Number of pixels touched.
+    """
+    c0, r0, c1, r1 = region
+    cols = c1 - c0 + 1
+    rows = r1 - r0 + 1
+    w = cols * GRID_SIZE
+    h = rows * GRID_SIZE
+    display.blit_buffer(
+        layout.col_px[c0], layout.row_px[r0], w, h, grid_buffer(cols, rows)
+    )
+
+    if in_region(food.position, region):
+        draw_food(display, food.position, layout)
+    color = SNAKE_HEAD_COLOR
+    for cell in snake.segments:
+        if in_region(cell, region):
+            draw_cell(display, cell, color, layout)
+        color = SNAKE_BODY_COLOR
+    return w * h
+
+
+class Hud:
+    """
+    Score HUD drawn over the playfield.
+
+    Text positions and the grid cells under each field are computed once per
+    round. The values drawn into each of the two framebuffers are cached, so
+    a field is only repainted when its value in the back buffer is stale or
+    the snake moves underneath it.
+    """
+
+    def __init__(self, width, layout):
+        self.layout = layout
+        self.score_x = HUD_MARGIN
+        self.score_y = HUD_MARGIN
+        self.value_y = HUD_MARGIN + 22
+        self.right_edge = width - HUD_MARGIN
+        self.best_label_width = text_pixel_width("BEST")
+        self.best_value_x = self.right_edge - self.best_label_width
+        self._best_digits = 1
+        self.score_region = layout.cell_range(
+            self.score_x, self.score_y, HUD_BOX_W, HUD_BOX_H
+        )
+        self.best_region = layout.cell_range(
+            self.right_edge - HUD_BOX_W + 2, self.score_y, HUD_BOX_W, HUD_BOX_H
+        )
+        # Last drawn values per framebuffer; index 0 is the back buffer
+        self._last_score = [None, None]
+        self._last_best = [None, None]
+
+    def _draw_score(self, display, score):
+        x = self.score_x
+        draw_text(display, "SCORE", x, self.score_y, HUD_COLOR, None, SHADOW_HUD)
+        draw_text(display, str(score), x, self.value_y, HUD_COLOR, None, SHADOW_HUD)
+        self._last_score[0] = score
+
+    def _draw_best(self, display, best):
+        value = str(best)
+        # The block is right-aligned and only widens past the label width
+        # once the value gains digits, so the position rarely moves
+        if len(value) != self._best_digits:
+            block_width = max(self.best_label_width, text_pixel_width(value))
+            self.best_value_x = self.right_edge - block_width
+            self._best_digits = len(value)
+        x = self.best_value_x
+        draw_text(display, "BEST", x, self.score_y, HUD_COLOR, None, SHADOW_HUD)
+        draw_text(display, value, x, self.value_y, HUD_COLOR, None, SHADOW_HUD)
+        self._last_best[0] = best
+
+    def draw(self, display, score, best):
+        """Draw both fields unconditionally (after a full scene redraw)."""
+        # One font selection for all four strings
+        display.set_font(FONT_HUD)
+        self._draw_score(display, score)
+        self._draw_best(display, best)
+
+    def update(self, display, snake, food, score, best, touched=()):
+        """
+        Repaint only the HUD fields that need it in the back buffer.
+
+        Args:
+            touched: Grid cells drawn this frame; a field whose cells were
+                drawn over is repainted even if its value is unchanged.
+
+        Returns:
+            int: Number of pixels touched.
+        """
+        score_dirty = score != self._last_score[0]
+        best_dirty = best != self._last_best[0]
+        for cell in touched:
+            score_dirty = score_dirty or in_region(cell, self.score_region)
+            best_dirty = best_dirty or in_region(cell, self.best_region)
+        if not (score_dirty or best_dirty):
+            return 0
+
+        area = 0
+        display.set_font(FONT_HUD)
+        if score_dirty:
+            area += restore_region(display, snake, food, self.score_region, self.layout)
+            self._draw_score(display, score)
+        if best_dirty:
+            area += restore_region(display, snake, food, self.best_region, self.layout)
+            self._draw_best(display, best)
+        return area
+
+    def swapped(self, copy):
+        """Track a swap_buffers() call so the cache follows the new back buffer."""
+        if copy:
+            self._last_score[1] = self._last_score[0]
+            self._last_best[1] = self._last_best[0]
+        else:
+            self._last_score.reverse()
+            self._last_best.reverse()
+
+
+def draw_scene_full(display, snake, food, score, best, layout, hud):
     """Draw the complete game scene."""
-    width = display.width
-    height = display.height
+    if layout.offset_x or layout.offset_y:
+        display.fill_color(BG_COLOR)
+    draw_grid(display, layout)
+    draw_food(display, food.position, layout)
+    draw_snake(display, snake, layout)
+    hud.draw(display, score, best)
+
+
+def frame_ops(snake, food, prev_tail, old_food):
+    """Return the (cell, color) paints that turn the previous frame into this one."""
+    ops = []
+    if prev_tail is not None:
+        ops.append((prev_tail, BG_COLOR))
+    segments = snake.segments
+    if len(segments) > 1:
+        ops.append((segments[1], SNAKE_BODY_COLOR))
+    ops.append((segments[0], SNAKE_HEAD_COLOR))
+    # Food is painted once per spawn; the eaten cell is already covered by
+    # the head, so it never needs erasing
+    if old_food is not None:
+        ops.append((food.position, FOOD_COLOR))
+    return ops
+
+
+def apply_ops(display, ops, layout):
+    """Paint a list of (cell, color) ops from frame_ops()."""
+    for cell, color in ops:
+        if color == FOOD_COLOR:
+            draw_food(display, cell, layout)
+        else:
+            draw_cell(display, cell, color, layout)
 
-    # Calculate offsets to center the grid
-    grid_width = GRID_COLS * GRID_SIZE
-    grid_height = GRID_ROWS * GRID_SIZE
-    offset_x = (width - grid_width) // 2
-    offset_y = (height - grid_height) // 2
 
-    display.fill_color(BG_COLOR)
-    draw_grid(display, offset_x, offset_y)
-    draw_food(display, food, offset_x, offset_y)
-    draw_snake(display, snake, offset_x, offset_y)
-    draw_hud(display, score, best, width)
+def draw_scene_delta(display, snake, food, ops, pending, score, best, layout, hud):
+    """Bring the back buffer up to date by repainting changed cells only.
+
+    With swap_buffers(copy=False) the back buffer still holds the frame from
+    two swaps ago, so the previous frame's ops are replayed before this
+    frame's.
+
+    Args:
+        ops: Paints for this tick (see frame_ops()).
+        pending: Paints for the previous tick, already shown in the front
+            buffer but not yet in the back buffer.
+        layout: GridLayout for the current round.
+        hud: Hud for the current round.
+
+    Returns:
+        int: Number of pixels touched.
+    """
+    apply_ops(display, pending, layout)
+    apply_ops(display, ops, layout)
+    cells = [cell for cell, _ in pending]
+    cells.extend(cell for cell, _ in ops)
+    area = len(cells) * GRID_SIZE * GRID_SIZE
+    area += hud.update(display, snake, food, score, best, cells)
+    return area
 
 
 # ---------------------------------------------------------------------------
@@ -441,7 +716,52 @@ def draw_scene(display, snake, food, score, best):
 # ---------------------------------------------------------------------------
 
 
-def play_round(display, joystick, best_score):
+class InputState:
+    """Joystick state shared between the input task and the game tick."""
+
+    def __init__(self):
+        self.direction = None  # Latest pressed direction not yet consumed
+        self.running = True
+
+
+async def poll_joystick(joystick, state):
+    """Poll the joystick off the game tick, latching the last direction."""
+    while state.running:
+        joystick.poll()
+        direction = joystick.get_direction()
+        if direction:
+            state.direction = direction
+        await asyncio.sleep(INPUT_POLL_INTERVAL)
+
+
+def tick(snake, food, new_direction):
+    """
+    Advance the game by one step. Pure game logic, no drawing or I/O.
+
+    Returns:
+        tuple: (prev_tail, old_food, crashed) where prev_tail is the vacated
+        tail cell (or None), old_food is the eaten food cell (or None) and
+        crashed is True if the snake hit a wall or itself.
+    """
+    if new_direction:
+        snake.set_direction(new_direction)
+
+    prev_tail = snake.move()
+
+    crashed = (
+        snake.collides_with_walls(GRID_COLS, GRID_ROWS) or snake.collides_with_self()
+    )
+
+    old_food = None
+    if snake.get_head() == food.position:
+        snake.grow()
+        old_food = food.position
+        food.respawn(GRID_COLS, GRID_ROWS, snake.occupied)
+
+    return prev_tail, old_food, crashed
+
+
+async def play_round(display, joystick, best_score):
     """Play one round of Snake."""
     width = display.width
     height = display.height
@@ -450,7 +770,7 @@ def play_round(display, joystick, best_score):
     start_x = GRID_COLS // 2
     start_y = GRID_ROWS // 2
     snake = Snake(start_x, start_y)
-    food = Food(GRID_COLS, GRID_ROWS, snake.segments)
+    food = Food(GRID_COLS, GRID_ROWS, snake.occupied)
 
     score = 0
     local_best = best_score
@@ -458,50 +778,82 @@ def play_round(display, joystick, best_score):
     game_over = False
     elapsed_timer = time.monotonic()
 
-    while not game_over:
-        frame_start = time.monotonic()
+    # Layout is fixed for the whole round
+    layout = GridLayout(width, height)
+    hud = Hud(width, layout)
 
-        # Handle input
-        new_direction = joystick.get_direction()
-        if new_direction:
-            snake.set_direction(new_direction)
+    # Paint everything once and copy it into both framebuffers; later
+    # frames only touch changed cells
+    draw_scene_full(display, snake, food, score, local_best, layout, hud)
+    display.swap_buffers(copy=True)
+    hud.swapped(True)
+    pending = ()
 
-        # Move snake
-        snake.move()
+    # Input is polled in its own task while this one sleeps between ticks
+    state = InputState()
+    input_task = asyncio.create_task(poll_joystick(joystick, state))
 
-        # Check collisions
-        if (
-            snake.collides_with_walls(GRID_COLS, GRID_ROWS)
-            or snake.collides_with_self()
-        ):
-            game_over = True
+    while not game_over:
+        frame_start = time.monotonic_ns()
+
+        # Advance game state
+        new_direction = state.direction
+        state.direction = None
+        prev_tail, old_food, game_over = tick(snake, food, new_direction)
 
-        # Check food collision
-        if snake.get_head() == food.position:
-            snake.grow()
+        if old_food is not None:
             score += SCORE_PER_FOOD
             if score > local_best:
                 local_best = score
             speed = min(speed + SPEED_INCREMENT, MAX_SPEED)
-            food.respawn(GRID_COLS, GRID_ROWS, snake.segments)
-
-        # Draw scene
-        draw_scene(display, snake, food, score, local_best)
-        display.swap_buffers(copy=False)
 
-        # Status update
-        if time.monotonic() - elapsed_timer >= 1.0:
+        # Draw scene (the head is off-grid after a wall hit, so keep the
+        # last valid frame on screen under the game-over overlay)
+        if not game_over:
+            ops = frame_ops(snake, food, prev_tail, old_food)
+            area = draw_scene_delta(
+                display, snake, food, ops, pending, score, local_best, layout, hud
+            )
+            if area > FULL_REDRAW_AREA:
+                # A frame this large is cheaper to repaint whole; the pending
+                # replay keeps both buffers in sync otherwise, so smaller
+                # frames never need a resync
+                draw_scene_full(display, snake, food, score, local_best, layout, hud)
+                display.swap_buffers(copy=True)
+                hud.swapped(True)
+                pending = ()
+            else:
+                display.swap_buffers(copy=False)
+                hud.swapped(False)
+                pending = ops
+
+        # Status update (serial output blocks the loop, so off by default)
+        if DEBUG_HUD and time.monotonic() - elapsed_timer >= 1.0:
             elapsed_timer = time.monotonic()
             print(
                 f"Score: {score:03d}  Length: {len(snake.segments):02d}  Speed: {speed:.1f}"
             )
 
-        # Frame timing
-        frame_time = 1.0 / speed
-        frame_elapsed = time.monotonic() - frame_start
-        if frame_elapsed < frame_time:
-            time.sleep(frame_time - frame_elapsed)
+        # Frame timing: coarse sleep (lets the input task run), then spin
+        # for the last FRAME_SPIN_NS to hit the deadline without oversleeping.
+        # A late frame starts the next one immediately instead of skipping a
+        # draw, since each frame only draws its own delta.
+        deadline = frame_start + int(NS_PER_SECOND / speed)
+        remaining = deadline - time.monotonic_ns()
+        if remaining > FRAME_SPIN_NS:
+            await asyncio.sleep((remaining - FRAME_SPIN_NS) / NS_PER_SECOND)
+        else:
+            await asyncio.sleep(0)
+        while time.monotonic_ns() < deadline:
+            pass
 
+    # The game-over overlay is drawn into the back buffer, so catch it up
+    # with the last frame shown
+    apply_ops(display, pending, layout)
+    hud.update(display, snake, food, score, local_best, [cell for cell, _ in pending])
+
+    state.running = False
+    await input_task
     return score, local_best
 
 
@@ -510,8 +862,30 @@ def play_round(display, joystick, best_score):
 # ---------------------------------------------------------------------------
 
 
+async def run_game(display, joystick, session):
+    """Start screen → round → game over loop."""
+    while True:
+        # Show start screen
+        draw_start_screen(display, session["best"])
+        await joystick.wait_for_center()
+
+        # Play round
+        score, session["best"] = await play_round(display, joystick, session["best"])
+        print(f"\nRound finished. Score: {score}, Best: {session['best']}")
+
+        # Show game over screen
+        draw_game_over(display, score, session["best"], display.width, display.height)
+        display.swap_buffers()
+
+        # Wait for restart
+        await joystick.wait_for_center()
+
+
 def main():
     """Main game loop."""
+    if asyncio is None:
+        raise RuntimeError("asyncio library is required.")
+
     seed_value = int(time.monotonic() * 1000) & 0xFFFFFFFF
     random.seed(seed_value)
 
@@ -530,24 +904,10 @@ def main():
     i2c = busio.I2C(board.TP_SCL, board.TP_SDA, frequency=100000)
     joystick = JoystickInput(i2c)
 
-    best_score = 0
+    session = {"best": 0}
 
     try:
-        while True:
-            # Show start screen
-            draw_start_screen(display, best_score)
-            joystick.wait_for_center()
-
-            # Play round
-            score, best_score = play_round(display, joystick, best_score)
-            print(f"\nRound finished. Score: {score}, Best: {best_score}")
-
-            # Show game over screen
-            draw_game_over(display, score, best_score, display.width, display.height)
-            display.swap_buffers()
-
-            # Wait for restart
-            joystick.wait_for_center()
+        asyncio.run(run_game(display, joystick, session))
 
     except KeyboardInterrupt:
         print("\nInterrupted. Exiting.")
@@ -557,7 +917,7 @@ def main():
         display.deinit()
         joystick.deinit()
         i2c.deinit()
-        print("\nBest score this session:", best_score)
+        print("\nBest score this session:", session["best"])
 
 
 if __name__ == "__main__":
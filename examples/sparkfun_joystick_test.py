@@ -50,20 +50,58 @@ CENTER_X = 512
 CENTER_Y = 512
 DEADZONE = 50  # Deadzone around center
 
+I2C_LOCK_TIMEOUT = 1.0  # seconds
+
+
+def lock_i2c(i2c, timeout=I2C_LOCK_TIMEOUT):
+    """Acquire the I2C bus lock, yielding between attempts."""
+    start = time.monotonic()
+    while not i2c.try_lock():
+        if time.monotonic() - start > timeout:
+            raise RuntimeError("I2C bus lock timeout")
+        time.sleep(0)
+
 
 def scan_i2c(i2c):
-    """Scan I2C bus and return list of found device addresses."""
+    """
+    Scan I2C bus and probe joystick candidates in the same pass.
+
+    Any responding address in JOYSTICK_POSSIBLE_ADDRS has its ID register
+    read while the bus is still locked, so no second pass is needed.
+
+    Returns:
+        tuple: (devices, joystick_addr) where joystick_addr is None if no
+               SparkFun Joystick was found
+    """
     print("\nScanning I2C bus (SDA=GPIO47, SCL=GPIO48)...")
     print("     0  1  2  3  4  5  6  7  8  9  a  b  c  d  e  f")
 
     devices = []
+    joystick_addr = None
+    probe_results = []  # Printed after the scan table
+    result = bytearray(1)
     for addr in range(0x08, 0x78):  # Valid I2C address range
         try:
-            while not i2c.try_lock():
-                pass
+            lock_i2c(i2c)
             try:
                 i2c.writeto(addr, b"")
                 devices.append(addr)
+                if addr in JOYSTICK_POSSIBLE_ADDRS and joystick_addr is None:
+                    try:
+                        i2c.writeto_then_readfrom(addr, bytes([REG_ID]), result)
+                        if result[0] == JOYSTICK_DEVICE_ID:
+                            joystick_addr = addr
+                            probe_results.append(
+                                f"✓ Found SparkFun Joystick at 0x{addr:02X}"
+                            )
+                        else:
+                            probe_results.append(
+                                f"✗ Device at 0x{addr:02X} has ID 0x{result[0]:02X} (not a joystick)"
+                            )
+                    except OSError as e:
+                        probe_results.append(
+                            f"✗ Error reading device at 0x{addr:02X}: {e}"
+                        )
                 if (addr % 16) == 0:
                     print(f"{(addr // 16):x}0:", end=" ")
                 print(f"{addr:02x}", end=" ")
@@ -94,7 +132,11 @@ def scan_i2c(i2c):
         device_name = known_devices.get(addr, "Unknown")
         print(f"  0x{addr:02X} ({addr:3d}) - {device_name}")
 
-    return devices
+    print("\nLooking for SparkFun Joystick...")
+    for line in probe_results:
+        print(line)
+
+    return devices, joystick_addr
 
 
 class SparkFunJoystick:
@@ -122,22 +164,25 @@ class SparkFunJoystick:
         except Exception as e:
             raise RuntimeError(f"Failed to initialize joystick at 0x{address:02X}: {e}")
 
-    def _read_register(self, register):
-        """Read a single byte from a register."""
-        while not self.i2c.try_lock():
-            pass
+    def _read_registers(self, start, count):
+        """
+        Read consecutive registers in one I2C transaction.
+
+        The joystick auto-increments its register pointer, so a single
+        write of ``start`` followed by a ``count``-byte read returns
+        registers ``start`` .. ``start + count - 1``.
+        """
+        lock_i2c(self.i2c)
         try:
-            result = bytearray(1)
-            self.i2c.writeto_then_readfrom(self.address, bytes([register]), result)
-            return result[0]
+            result = bytearray(count)
+            self.i2c.writeto_then_readfrom(self.address, bytes([start]), result)
+            return result
         finally:
             self.i2c.unlock()
 
-    def _read_register_16bit(self, reg_msb):
-        """Read a 16-bit value from two consecutive registers (MSB first)."""
-        msb = self._read_register(reg_msb)
-        lsb = self._read_register(reg_msb + 1)
-        return (msb << 8) | lsb
+    def _read_register(self, register):
+        """Read a single byte from a register."""
+        return self._read_registers(register, 1)[0]
 
     def read_position(self):
         """
@@ -147,9 +192,9 @@ class SparkFunJoystick:
             tuple: (x, y) where x and y are 0-1023 (10-bit values)
                    Center is approximately (512, 512)
         """
-        x = self._read_register_16bit(REG_X_MSB)
-        y = self._read_register_16bit(REG_Y_MSB)
-        return x, y
+        # X_MSB, X_LSB, Y_MSB, Y_LSB in one transaction
+        buf = self._read_registers(REG_X_MSB, 4)
+        return (buf[0] << 8) | buf[1], (buf[2] << 8) | buf[3]
 
     def read_button(self):
         """
@@ -169,9 +214,13 @@ class SparkFunJoystick:
         Returns:
             dict: {'x': int, 'y': int, 'button': bool}
         """
-        x, y = self.read_position()
-        button = self.read_button()
-        return {"x": x, "y": y, "button": button}
+        # X_MSB .. Y_LSB plus BUTTON in one transaction
+        buf = self._read_registers(REG_X_MSB, 5)
+        return {
+            "x": (buf[0] << 8) | buf[1],
+            "y": (buf[2] << 8) | buf[3],
+            "button": buf[4] == 0,  # 0 = pressed, 1 = released
+        }
 
     def get_direction(self, x=None, y=None, deadzone=DEADZONE):
         """
@@ -224,41 +273,6 @@ class SparkFunJoystick:
         return "-".join(direction)
 
 
-def find_joystick(i2c, devices):
-    """
-    Try to find SparkFun Joystick among I2C devices.
-
-    Returns:
-        int or None: Joystick address if found, None otherwise
-    """
-    print("\nLooking for SparkFun Joystick...")
-
-    for addr in devices:
-        if addr not in JOYSTICK_POSSIBLE_ADDRS:
-            continue
-
-        try:
-            # Try to read device ID
-            while not i2c.try_lock():
-                pass
-            try:
-                result = bytearray(1)
-                i2c.writeto_then_readfrom(addr, bytes([REG_ID]), result)
-                if result[0] == JOYSTICK_DEVICE_ID:
-                    print(f"✓ Found SparkFun Joystick at 0x{addr:02X}")
-                    return addr
-                else:
-                    print(
-                        f"✗ Device at 0x{addr:02X} has ID 0x{result[0]:02X} (not a joystick)"
-                    )
-            finally:
-                i2c.unlock()
-        except Exception as e:
-            print(f"✗ Error reading device at 0x{addr:02X}: {e}")
-
-    return None
-
-
 def main():
     """Main test loop."""
     print("=" * 70)
@@ -272,8 +286,8 @@ def main():
     print("  SCL: GPIO48 (board.SCL)")
     i2c = busio.I2C(board.SCL, board.SDA, frequency=100000)
 
-    # Scan for devices
-    devices = scan_i2c(i2c)
+    # Scan for devices (also probes for the joystick)
+    devices, joystick_addr = scan_i2c(i2c)
 
     if not devices:
         print("\n❌ ERROR: No I2C devices found!")
@@ -283,9 +297,6 @@ def main():
         print("  - Correct I2C pins (SDA=GPIO47, SCL=GPIO48)")
         return
 
-    # Find joystick
-    joystick_addr = find_joystick(i2c, devices)
-
     if joystick_addr is None:
         print("\n❌ ERROR: SparkFun Joystick not found!")
         print("\nPossible issues:")
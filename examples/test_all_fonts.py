@@ -7,12 +7,46 @@ display = rm690b0.RM690B0()
 display.init_display()
 display.swap_buffers()
 
+# Bind methods and colors once; every draw call below is a local lookup
+text = display.text
+set_font = display.set_font
+fill_color = display.fill_color
+swap_buffers = display.swap_buffers
+BLACK = rm690b0.BLACK
+WHITE = rm690b0.WHITE
+RED = rm690b0.RED
+GREEN = rm690b0.GREEN
+BLUE = rm690b0.BLUE
+YELLOW = rm690b0.YELLOW
+CYAN = rm690b0.CYAN
+MAGENTA = rm690b0.MAGENTA
+
+# Time before which the page currently on screen must stay visible
+hold_until = 0.0
+
+
+def show_page(hold):
+    """
+    Show the page drawn in the back buffer and keep it up for `hold` seconds.
+
+    Instead of sleeping right after the swap, the hold is waited out before
+    the *next* swap, so the following page is drawn while this one is on
+    screen. Every page starts with fill_color(), so the swap skips the copy.
+    """
+    global hold_until
+    remaining = hold_until - time.monotonic()
+    if remaining > 0:
+        time.sleep(remaining)
+    swap_buffers(copy=False)
+    hold_until = time.monotonic() + hold
+
+
 print("=" * 60)
 print("RM690B0 All Fonts Test")
 print("=" * 60)
 
-# Font configurations: (id, name, width, height)
-fonts = [
+# Font configurations: (id, name, width, height); a fixed table, so a tuple
+fonts = (
     (rm690b0.FONT_8x8, "8x8", 8, 8),
     (rm690b0.FONT_16x16, "16x16", 16, 16),
     (rm690b0.FONT_16x24, "16x24", 16, 24),
@@ -20,152 +54,147 @@ fonts = [
     (rm690b0.FONT_24x32, "24x32", 24, 32),
     (rm690b0.FONT_32x32, "32x32", 32, 32),
     (rm690b0.FONT_32x48, "32x48", 32, 48),
-]
+)
 
 # Test each font
 for font_id, font_name, width, height in fonts:
     print(f"\n[Font {font_id}] Testing {font_name} ({width}x{height})...")
 
-    display.fill_color(rm690b0.BLACK)
-    display.set_font(font_id)
+    fill_color(BLACK)
+    set_font(font_id)
 
     # Title
-    display.text(10, 10, f"Font {font_id}: {font_name}", rm690b0.WHITE)
+    text(10, 10, f"Font {font_id}: {font_name}", WHITE)
 
     # Sample text at appropriate size
     y_pos = 10 + height + 5
 
     if height <= 16:
         # Small fonts - show more text
-        display.text(10, y_pos, "ABCDEFGHIJKLMNOPQRSTUVWXYZ", rm690b0.CYAN)
+        text(10, y_pos, "ABCDEFGHIJKLMNOPQRSTUVWXYZ", CYAN)
         y_pos += height
-        display.text(10, y_pos, "abcdefghijklmnopqrstuvwxyz", rm690b0.GREEN)
+        text(10, y_pos, "abcdefghijklmnopqrstuvwxyz", GREEN)
         y_pos += height
-        display.text(10, y_pos, "0123456789 !@#$%^&*()", rm690b0.YELLOW)
+        text(10, y_pos, "0123456789 !@#$%^&*()", YELLOW)
     elif height <= 24:
         # Medium fonts
-        display.text(10, y_pos, "ABCDEFGHIJKLMNOP", rm690b0.CYAN)
+        text(10, y_pos, "ABCDEFGHIJKLMNOP", CYAN)
         y_pos += height
-        display.text(10, y_pos, "abcdefghijklmnop", rm690b0.GREEN)
+        text(10, y_pos, "abcdefghijklmnop", GREEN)
         y_pos += height
-        display.text(10, y_pos, "0123456789", rm690b0.YELLOW)
+        text(10, y_pos, "0123456789", YELLOW)
     elif height <= 32:
         # Large fonts
-        display.text(10, y_pos, "ABCDEFGH", rm690b0.CYAN)
+        text(10, y_pos, "ABCDEFGH", CYAN)
         y_pos += height
-        display.text(10, y_pos, "abcdefgh", rm690b0.GREEN)
+        text(10, y_pos, "abcdefgh", GREEN)
         y_pos += height
-        display.text(10, y_pos, "01234567", rm690b0.YELLOW)
+        text(10, y_pos, "01234567", YELLOW)
     else:
         # Very large fonts
-        display.text(10, y_pos, "ABCDEF", rm690b0.CYAN)
+        text(10, y_pos, "ABCDEF", CYAN)
         y_pos += height
-        display.text(10, y_pos, "abcdef", rm690b0.GREEN)
+        text(10, y_pos, "abcdef", GREEN)
         y_pos += height
-        display.text(10, y_pos, "012345", rm690b0.YELLOW)
+        text(10, y_pos, "012345", YELLOW)
 
-    display.swap_buffers()
-    time.sleep(2)
+    show_page(2)
 
 # Size comparison - show all fonts with same text
 print("\n[Comparison] Showing all fonts with 'Hello'...")
-display.fill_color(rm690b0.BLACK)
+fill_color(BLACK)
 
 y_pos = 5
 for font_id, font_name, width, height in fonts:
     if y_pos + height > display.height:
         break
-    display.set_font(font_id)
-    display.text(5, y_pos, "Hello!", rm690b0.WHITE)
+    set_font(font_id)
+    text(5, y_pos, "Hello!", WHITE)
     y_pos += height + 2
 
-display.swap_buffers()
-time.sleep(3)
+show_page(3)
 
 # Performance test
 print("\n[Performance] Testing rendering speed...")
-display.fill_color(rm690b0.BLACK)
+fill_color(BLACK)
 
 for font_id, font_name, width, height in fonts:
-    display.set_font(font_id)
-    start = time.monotonic()
+    set_font(font_id)
+    start = time.monotonic_ns()
     for i in range(10):
-        display.text(10, 10, "Test", rm690b0.WHITE)
-    elapsed = time.monotonic() - start
+        text(10, 10, "Test", WHITE)
+    elapsed = (time.monotonic_ns() - start) / 1e9
     print(
         f"  Font {font_id} ({font_name}): {elapsed:.3f}s for 10 renders ({elapsed / 10 * 1000:.1f}ms each)"
     )
 
 # Color test with medium font
 print("\n[Colors] Testing colors with 16x16 font...")
-display.fill_color(rm690b0.BLACK)
-display.set_font(rm690b0.FONT_16x16)
+fill_color(BLACK)
+set_font(rm690b0.FONT_16x16)
 
 colors = [
-    (rm690b0.WHITE, "WHITE"),
-    (rm690b0.RED, "RED"),
-    (rm690b0.GREEN, "GREEN"),
-    (rm690b0.BLUE, "BLUE"),
-    (rm690b0.YELLOW, "YELLOW"),
-    (rm690b0.CYAN, "CYAN"),
-    (rm690b0.MAGENTA, "MAGENTA"),
+    (WHITE, "WHITE"),
+    (RED, "RED"),
+    (GREEN, "GREEN"),
+    (BLUE, "BLUE"),
+    (YELLOW, "YELLOW"),
+    (CYAN, "CYAN"),
+    (MAGENTA, "MAGENTA"),
 ]
 
 y_pos = 10
 for color, name in colors:
-    display.text(10, y_pos, name, color)
+    text(10, y_pos, name, color)
     y_pos += 18
 
-display.swap_buffers()
-time.sleep(2)
+show_page(2)
 
 # Background test
 print("\n[Background] Testing background colors...")
-display.fill_color(rm690b0.BLACK)
-display.set_font(rm690b0.FONT_16x24)
+fill_color(BLACK)
+set_font(rm690b0.FONT_16x24)
 
-display.text(10, 10, "White on Red", rm690b0.WHITE, rm690b0.RED)
-display.text(10, 40, "Black on Cyan", rm690b0.BLACK, rm690b0.CYAN)
-display.text(10, 70, "Yellow on Blue", rm690b0.YELLOW, rm690b0.BLUE)
-display.text(10, 100, "Green on Black", rm690b0.GREEN, rm690b0.BLACK)
+text(10, 10, "White on Red", WHITE, RED)
+text(10, 40, "Black on Cyan", BLACK, CYAN)
+text(10, 70, "Yellow on Blue", YELLOW, BLUE)
+text(10, 100, "Green on Black", GREEN, BLACK)
 
-display.swap_buffers()
-time.sleep(2)
+show_page(2)
 
 # Mixed sizes demo
 print("\n[Demo] Mixed font sizes...")
-display.fill_color(rm690b0.BLACK)
+fill_color(BLACK)
 
-display.set_font(rm690b0.FONT_32x48)  # Largest
-display.text(10, 10, "Big", rm690b0.WHITE)
+set_font(rm690b0.FONT_32x48)  # Largest
+text(10, 10, "Big", WHITE)
 
-display.set_font(rm690b0.FONT_24x24)  # Medium
-display.text(10, 65, "Medium Text", rm690b0.CYAN)
+set_font(rm690b0.FONT_24x24)  # Medium
+text(10, 65, "Medium Text", CYAN)
 
-display.set_font(rm690b0.FONT_16x16)  # Small
-display.text(10, 95, "Small details here", rm690b0.YELLOW)
+set_font(rm690b0.FONT_16x16)  # Small
+text(10, 95, "Small details here", YELLOW)
 
-display.set_font(rm690b0.FONT_8x8)  # Tiny
-display.text(10, 115, "Tiny: Status, debug, logs", rm690b0.GREEN)
+set_font(rm690b0.FONT_8x8)  # Tiny
+text(10, 115, "Tiny: Status, debug, logs", GREEN)
 
-display.swap_buffers()
-time.sleep(3)
+show_page(3)
 
 # Final summary
-display.fill_color(rm690b0.BLACK)
-display.set_font(rm690b0.FONT_8x8)
-display.text(10, 10, "Font Test Summary", rm690b0.WHITE)
-display.text(10, 20, "=" * 70, rm690b0.CYAN)
+fill_color(BLACK)
+set_font(rm690b0.FONT_8x8)
+text(10, 10, "Font Test Summary", WHITE)
+text(10, 20, "=" * 70, CYAN)
 
 y_pos = 30
 for font_id, font_name, width, height in fonts:
-    text = f"{font_id}: {font_name:8s} ({width:2d}x{height:2d})"
-    display.text(10, y_pos, text, rm690b0.GREEN)
+    summary = f"{font_id}: {font_name:8s} ({width:2d}x{height:2d})"
+    text(10, y_pos, summary, GREEN)
     y_pos += 10
 
-display.text(10, y_pos + 10, "All 7 fonts available!", rm690b0.YELLOW)
-display.text(10, y_pos + 20, "Use display.set_font(0-6)", rm690b0.MAGENTA)
-display.swap_buffers()
+text(10, y_pos + 10, "All 7 fonts available!", YELLOW)
+text(10, y_pos + 20, "Use display.set_font(0-6)", MAGENTA)
+show_page(0)
 
 print("\n" + "=" * 60)
 print("Font test complete!")
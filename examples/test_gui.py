@@ -19,6 +19,10 @@ SYMBOL_BATTERY_FULL = "\uf240"
 SYMBOL_HOME = "\uf015"
 SYMBOL_KEYBOARD = "\uf11c"
 
+# Option lists, defined once and reused if the widgets are rebuilt
+ROLLER_MODES = "Normal\nEco\nPerformance\nCustom"
+DROPDOWN_THEMES = "Light\nDark\nAuto\nCustom"
+
 print("=" * 60)
 print("LVGL Python GUI Test")
 print("=" * 60)
@@ -81,9 +85,9 @@ print(f"Free memory after font load: {gc.mem_free()} bytes")
 print("Setting font to title...")
 #title.set_style_text_font(font)
 print("✓ Font applied to title")
-time.sleep(0.03)
-lvgl.task_handler()
 
+# No refresh here: the rest of the UI is rendered in one pass by the first
+# task_handler() call of the main loop
 title.x = (SCREEN_WIDTH - 120) // 2  # Center horizontally
 title.y = 10
 title.set_text_color(0x000080)  # Navy Blue
@@ -99,6 +103,36 @@ status_lbl.x = 20
 status_lbl.y = SCREEN_HEIGHT - 30
 status_lbl.set_text_color(0x606060)
 
+# Slider/arc drags update the status bar on every input sample; redraw the
+# label at most this often and keep only the latest text in between
+STATUS_MIN_INTERVAL = 0.1  # seconds
+status_pending = None
+status_shown_at = 0.0
+
+
+def set_status(text):
+    """Set the status bar text, coalescing updates that arrive too quickly."""
+    global status_pending, status_shown_at
+    now = time.monotonic()
+    if now - status_shown_at >= STATUS_MIN_INTERVAL:
+        status_lbl.text = text
+        status_shown_at = now
+        status_pending = None
+    else:
+        status_pending = text
+
+
+def flush_status():
+    """Show a coalesced status update once the interval has passed."""
+    global status_pending, status_shown_at
+    if status_pending is None:
+        return
+    now = time.monotonic()
+    if now - status_shown_at >= STATUS_MIN_INTERVAL:
+        status_lbl.text = status_pending
+        status_shown_at = now
+        status_pending = None
+
 
 # ============================================================================
 # Progress Bar with Button (Container Demo)
@@ -137,7 +171,7 @@ def update_bar(btn):
     else:
         bar.value = min(current + 20, 100)
     bar_lbl.text = f"Progress: {bar.value}%"
-    status_lbl.text = f"Bar: {bar.value}%"
+    set_status(f"Bar: {bar.value}%")
     print(f"Bar value: {bar.value}")
 
 
@@ -162,16 +196,16 @@ counter_lbl.set_text_color(0x000000)
 def on_inc_click(btn):
     global counter_val
     counter_val += 1
-    counter_lbl.text = f"Count: {counter_val}"
-    status_lbl.text = "Incremented!"
+    counter_lbl.text = "Count: " + str(counter_val)
+    set_status("Incremented!")
     print(f"Button clicked! Count: {counter_val}")
 
 
 def on_reset_click(btn):
     global counter_val
     counter_val = 0
-    counter_lbl.text = f"Count: {counter_val}"
-    status_lbl.text = "Reset!"
+    counter_lbl.text = "Count: " + str(counter_val)
+    set_status("Reset!")
     print("Reset clicked!")
 
 
@@ -201,10 +235,13 @@ slider_lbl.y = 130
 slider_lbl.set_text_color(0x000000)
 
 
-def on_slider_change(slider):
+# Fires continuously while dragging: labels are bound as default arguments
+# (local lookups), and the text is formatted once and shared
+def on_slider_change(slider, slider_lbl=slider_lbl, set_status=set_status):
     value = slider.value
-    slider_lbl.text = f"Slider: {value}"
-    status_lbl.text = f"Slider: {value}"
+    text = "Slider: " + str(value)
+    slider_lbl.text = text
+    set_status(text)
     print(f"Slider value: {value}")
 
 
@@ -219,12 +256,12 @@ slider.value = 50
 
 def set_slider_min(btn):
     slider.value = 0
-    status_lbl.text = "Slider: Min"
+    set_status("Slider: Min")
 
 
 def set_slider_max(btn):
     slider.value = 100
-    status_lbl.text = "Slider: Max"
+    set_status("Slider: Max")
 
 
 btn_slider_min = rm690b0_lvgl.Button(text="Min")
@@ -254,11 +291,11 @@ roller_lbl.set_text_color(0x000000)
 def on_roller_change(roller_obj):
     selected_text = roller_obj.selected_str
     roller_lbl.text = f"Mode: {selected_text}"
-    status_lbl.text = f"Mode set to {selected_text}"
+    set_status(f"Mode set to {selected_text}")
     print(f"Roller selection: {selected_text} (index {roller_obj.selected})")
 
 
-roller = rm690b0_lvgl.Roller(options="Normal\nEco\nPerformance\nCustom")
+roller = rm690b0_lvgl.Roller(options=ROLLER_MODES)
 roller.x = 30
 roller.y = 306
 roller.width = 160
@@ -280,7 +317,7 @@ checkbox1_lbl.set_text_color(0x000000)
 def on_checkbox1_change(cb):
     checked = cb.checked
     checkbox1_lbl.text = f"Feature: {'ON' if checked else 'OFF'}"
-    status_lbl.text = f"Feature: {'ON' if checked else 'OFF'}"
+    set_status(f"Feature: {'ON' if checked else 'OFF'}")
     print(f"Checkbox 1: {checked}")
 
 
@@ -299,7 +336,7 @@ checkbox2_lbl.set_text_color(0x000000)
 def on_checkbox2_change(cb):
     checked = cb.checked
     checkbox2_lbl.text = f"Auto: {'ON' if checked else 'OFF'}"
-    status_lbl.text = f"Auto: {'ON' if checked else 'OFF'}"
+    set_status(f"Auto: {'ON' if checked else 'OFF'}")
     print(f"Checkbox 2: {checked}")
 
 
@@ -319,7 +356,7 @@ switch_lbl.set_text_color(0x000000)
 def on_switch_change(sw):
     state = sw.checked
     switch_lbl.text = f"WiFi: {'ON' if state else 'OFF'}"
-    status_lbl.text = f"WiFi: {'Connected' if state else 'Disconnected'}"
+    set_status(f"WiFi: {'Connected' if state else 'Disconnected'}")
     print(f"WiFi Switch: {state}")
 
 
@@ -338,10 +375,13 @@ arc_lbl.y = 280
 arc_lbl.set_text_color(0x000000)
 
 
-def on_arc_change(arc):
-    arc_lbl.text = f"Volume: {arc.value}"
-    status_lbl.text = f"Volume: {arc.value}"
-    print(f"Arc value: {arc.value}")
+# Fires continuously while rotating; same local binding as on_slider_change
+def on_arc_change(arc, arc_lbl=arc_lbl, set_status=set_status):
+    value = arc.value
+    text = "Volume: " + str(value)
+    arc_lbl.text = text
+    set_status(text)
+    print(f"Arc value: {value}")
 
 
 arc = rm690b0_lvgl.Arc(min_value=0, max_value=100)
@@ -364,11 +404,11 @@ dropdown_lbl.set_text_color(0x000000)
 
 def on_dropdown_change(dd):
     dropdown_lbl.text = f"Theme: {dd.text}"
-    status_lbl.text = f"Theme changed to {dd.text}"
+    set_status(f"Theme changed to {dd.text}")
     print(f"Dropdown: {dd.text} (index: {dd.selected})")
 
 
-dropdown = rm690b0_lvgl.Dropdown(options="Light\nDark\nAuto\nCustom")
+dropdown = rm690b0_lvgl.Dropdown(options=DROPDOWN_THEMES)
 dropdown.x = 420
 dropdown.y = 70
 dropdown.width = 150
@@ -436,7 +476,7 @@ list_w.height = 100
 
 def on_list_btn_click(btn):
     list_lbl.text = f"List: {btn.text}"
-    status_lbl.text = f"List selected: {btn.text}"
+    set_status(f"List selected: {btn.text}")
     print(f"List item clicked: {btn.text}")
 
 
@@ -470,7 +510,7 @@ spinbox.set_step(5)
 def on_spinbox_change(sb):
     val = sb.value
     spinbox_lbl.text = f"Spinbox: {val}"
-    status_lbl.text = f"Spinbox value: {val}"
+    set_status(f"Spinbox value: {val}")
     print(f"Spinbox: {val}")
 
 
@@ -509,11 +549,11 @@ mbox = None
 def on_mbox_click(idx):
     global mbox
     if idx == 0:
-        status_lbl.text = "Msgbox: OK"
+        set_status("Msgbox: OK")
     elif idx == 1:
-        status_lbl.text = "Msgbox: Cancel"
+        set_status("Msgbox: Cancel")
     else:
-        status_lbl.text = "Msgbox: Closed"
+        set_status("Msgbox: Closed")
 
     if mbox:
         mbox.close()
@@ -565,7 +605,7 @@ tv.height = 160
 
 def on_tab_change(tv_obj):
     idx = tv_obj.active_tab
-    status_lbl.text = f"Tab changed to {idx}"
+    set_status(f"Tab changed to {idx}")
     print(f"Tab changed: {idx}")
 
 
@@ -645,18 +685,24 @@ chart.set_range(rm690b0_lvgl.CHART_AXIS_PRIMARY_Y, 0, 100)
 
 temp_series = chart.add_series(0xFF6600)
 humid_series = chart.add_series(0x0066FF)
-temp_series.set_points([22, 34, 40, 38, 47, 55, 60, 64, 70, 72, 74, 78])
-humid_series.set_points([78, 74, 72, 69, 65, 63, 60, 58, 55, 52, 50, 48])
+TEMP_POINTS = [22, 34, 40, 38, 47, 55, 60, 64, 70, 72, 74, 78]
+HUMID_POINTS = [78, 74, 72, 69, 65, 63, 60, 58, 55, 52, 50, 48]
+temp_series.set_points(TEMP_POINTS)
+humid_series.set_points(HUMID_POINTS)
 chart_step = 0
 
 
+def chart_sample(step):
+    """Return the synthetic (temperature, humidity) reading for a chart step."""
+    return (22 + step * 11) % 100, max(25, 80 - (step * 7) % 55)
+
+
 def update_chart_series(_=None):
     global chart_step
-    next_temp = (22 + (chart_step * 11)) % 100
-    next_hum = max(25, 80 - ((chart_step * 7) % 55))
+    next_temp, next_hum = chart_sample(chart_step)
     temp_series.append(next_temp)
     humid_series.append(next_hum)
-    status_lbl.text = f"Chart updated: T={next_temp}°C / H={next_hum}%"
+    set_status(f"Chart updated: T={next_temp}°C / H={next_hum}%")
     chart_step += 1
 
 
@@ -687,7 +733,7 @@ def nudge_scale(_=None):
     new_val = (scale.value + 18) % 181
     scale.value = new_val
     scale_lbl.text = f"Gauge: {new_val}°"
-    status_lbl.text = f"Gauge updated to {new_val}°"
+    set_status(f"Gauge updated to {new_val}°")
 
 
 btn_gauge = rm690b0_lvgl.Button(text="Next Gauge")
@@ -707,15 +753,18 @@ canvas = rm690b0_lvgl.Canvas(180, 130, rm690b0_lvgl.IMG_CF_TRUE_COLOR)
 canvas.x = 220
 canvas.y = 1050
 
+# Canvas geometry never changes, so build it once instead of on every redraw
+CANVAS_TRAIL = [(10, 120), (40, 20), (70, 80), (110, 30), (160, 110)]
+CANVAS_DOTS = tuple((offset, (offset // 2) % 120) for offset in range(0, 170, 15))
+
 
 def refresh_canvas(_=None):
     canvas.fill_bg(0x101010)
-    canvas.draw_line(
-        [(10, 120), (40, 20), (70, 80), (110, 30), (160, 110)], color=0x00FFAA, width=4
-    )
-    for offset in range(0, 170, 15):
-        canvas.set_px(offset, (offset // 2) % 120, 0xFFFFFF)
-    status_lbl.text = "Canvas refreshed"
+    canvas.draw_line(CANVAS_TRAIL, color=0x00FFAA, width=4)
+    set_px = canvas.set_px
+    for x, y in CANVAS_DOTS:
+        set_px(x, y, 0xFFFFFF)
+    set_status("Canvas refreshed")
 
 
 refresh_canvas()
@@ -736,7 +785,8 @@ line_lbl.set_text_color(0x202020)
 line = rm690b0_lvgl.Line()
 line.x = 420
 line.y = 1050
-line.set_points([(0, 120), (40, 40), (80, 100), (120, 20), (160, 90)])
+LINE_POINTS = [(0, 120), (40, 40), (80, 100), (120, 20), (160, 90)]
+line.set_points(LINE_POINTS)
 line.line_width = 3
 line.line_color = 0xFF00FF
 line.y_invert = True
@@ -747,7 +797,7 @@ line.y_invert = True
 # ============================================================================
 def on_textarea_change(ta):
     print(f"Textarea updated: {ta.text}")
-    status_lbl.text = f"Text: {ta.text}"
+    set_status(f"Text: {ta.text}")
 
 
 ta = rm690b0_lvgl.Textarea()
@@ -766,7 +816,7 @@ def on_btnm_click(btnm):
     btn_idx = btnm.selected_btn
     btn_text = btnm.selected_btn_text
     print(f"Buttonmatrix: Btn {btn_idx} -> '{btn_text}'")
-    status_lbl.text = f"Keypad: {btn_text or btn_idx}"
+    set_status(f"Keypad: {btn_text or btn_idx}")
 
 
 keys = [
@@ -807,6 +857,8 @@ keyboard_layer = None
 keyboard = None
 current_scroll_y = 0
 previous_scroll_y = 0
+# The textarea never moves or resizes, so the keyboard anchor is fixed
+KEYBOARD_ANCHOR_Y = ta.y + ta.height + KEYBOARD_MARGIN
 
 
 def _scroll_screen_to(y):
@@ -817,11 +869,6 @@ def _scroll_screen_to(y):
     lvgl.scroll_screen(y=y)
 
 
-def _keyboard_anchor_y():
-    print("anchor", ta.y, ta.height, KEYBOARD_MARGIN)
-    return ta.y + ta.height + KEYBOARD_MARGIN
-
-
 def _ensure_keyboard_objects():
     global keyboard_layer, keyboard
     if keyboard_layer is not None and keyboard is not None:
@@ -831,16 +878,18 @@ def _ensure_keyboard_objects():
     layer.width = SCREEN_WIDTH
     layer.height = 0  # start collapsed so it doesn't affect layout
     layer.x = 0
-    layer.y = _keyboard_anchor_y()
+    layer.y = KEYBOARD_ANCHOR_Y
     layer.set_style_bg_color(0x000000)
     layer.set_style_bg_opa(0)
 
+    # The keyboard gets its final geometry once; the collapsed layer clips it
+    # (and its touch area), so showing/hiding only resizes the layer
     kb = rm690b0_lvgl.Keyboard()
     kb.set_parent(layer)
-    kb.width = 0
-    kb.height = 0
+    kb.width = SCREEN_WIDTH - 20
+    kb.height = KEYBOARD_HEIGHT
     kb.x = 0
-    kb.y = 0
+    kb.y = KEYBOARD_MARGIN
     kb.set_style_bg_color(0x101010)
     kb.set_style_bg_opa(235)
     kb.set_popovers(True)
@@ -857,12 +906,9 @@ def hide_keyboard(_=None, *, clear_text=False):
     if clear_text:
         ta.text = ""
     keyboard.set_textarea(None)
-    keyboard_layer.y = _keyboard_anchor_y()
     keyboard_layer.height = 0
-    keyboard.width = 0
-    keyboard.height = 0
     keyboard_visible = False
-    status_lbl.text = "Keyboard hidden"
+    set_status("Keyboard hidden")
     _scroll_screen_to(previous_scroll_y)
     previous_scroll_y = current_scroll_y
 
@@ -873,18 +919,11 @@ def show_keyboard(_=None):
         return
     previous_scroll_y = lvgl.get_scroll_y()
     _ensure_keyboard_objects()
-    anchor_y = _keyboard_anchor_y()
     keyboard_layer.height = KEYBOARD_LAYER_HEIGHT
-    keyboard_layer.y = anchor_y
-    keyboard.width = SCREEN_WIDTH - 20
-    keyboard.height = KEYBOARD_HEIGHT
-    keyboard.x = 0
-    keyboard.y = KEYBOARD_MARGIN
     keyboard_visible = True
     keyboard.set_textarea(ta)
-    status_lbl.text = "Keyboard ready"
-    scroll_y = anchor_y + KEYBOARD_LAYER_HEIGHT - SCREEN_HEIGHT
-    print("show keyboard", keyboard_layer.y, keyboard_layer.height, SCREEN_HEIGHT)
+    set_status("Keyboard ready")
+    scroll_y = KEYBOARD_ANCHOR_Y + KEYBOARD_LAYER_HEIGHT - SCREEN_HEIGHT
     if scroll_y < 0:
         scroll_y = 0
     _scroll_screen_to(scroll_y)
@@ -949,10 +988,23 @@ print("  - Scale: Use 'Next Gauge' to rotate the meter needle")
 print("  - Canvas: Press 'Redraw Canvas' to regenerate the sparkline")
 print("  - Line: Static polyline rendered using the Line widget")
 
+# LVGL is serviced on a fixed 50 ms period (required for touch responsiveness
+# with images). Sleeping only until the next tick deadline, rather than a flat
+# 50 ms after each pass, keeps the rate steady however long a render takes,
+# and the MCU idles inside time.sleep() between ticks.
+TICK_PERIOD_NS = 50_000_000
+
 try:
+    next_tick = time.monotonic_ns()
     while True:
+        flush_status()
         lvgl.task_handler()
-        time.sleep(0.05)  # 50ms - required for touch responsiveness with images
+        next_tick += TICK_PERIOD_NS
+        now = time.monotonic_ns()
+        if next_tick > now:
+            time.sleep((next_tick - now) / 1e9)
+        else:
+            next_tick = now  # Overran a tick: resync instead of bursting
 
 except KeyboardInterrupt:
     print("\nExiting...")
@@ -9,13 +9,85 @@ Usage:
     python test_converted_font.py font_file.h
     python test_converted_font.py font_file.h --char A
     python test_converted_font.py font_file.h --all
+
+With --cache, the parsed header is saved next to it as <name>.h.cache.json and
+reused while the header is unchanged.
 """
 
 import argparse
+import json
+import mmap
 import re
 import sys
 from pathlib import Path
 
+# Header comment patterns, compiled once; the array itself is located with
+# plain find() scans (see find_font_array). Bytes patterns, because the header
+# is parsed straight from a memory map
+SIZE_PATTERN = re.compile(rb"Size:\s*(\d+)x(\d+)\s*pixels")
+RANGE_PATTERN = re.compile(rb"Characters:\s*0x([0-9A-Fa-f]+)\.\.0x([0-9A-Fa-f]+)")
+ARRAY_DECL = b"static const uint8_t"
+
+# Bump when the cache file layout changes, so caches written by an older
+# version of this script are ignored
+CACHE_VERSION = 3
+
+# Binary digit -> ASCII-art pixel: middle dot for empty, full block for set bits
+PIXEL_CHARS = str.maketrans("01", "·█")
+
+
+def find_font_array(content):
+    """
+    Locate the glyph array in a header with linear find() scans.
+
+    Args:
+        content: Header contents as bytes or a memory map
+
+    Returns:
+        (font_name, body_start, body_end) with the offsets of the array body,
+        or (None, None, None) if no array is declared
+    """
+    decl = content.find(ARRAY_DECL)
+    if decl < 0:
+        return None, None, None
+    name_end = content.find(b"_data[", decl)
+    if name_end < 0:
+        return None, None, None
+    body_start = content.find(b"{", name_end)
+    body_end = content.find(b"};", body_start)
+    if body_start < 0 or body_end < 0:
+        return None, None, None
+    font_name = content[decl + len(ARRAY_DECL) : name_end].strip().decode("utf-8")
+    return font_name, body_start + 1, body_end
+
+
+def iter_glyph_entries(content, start, end):
+    """
+    Yield (codepoint, char_display, byte_data_str) for each glyph in the array.
+
+    Each glyph is a "// 0xNN 'c'" comment line followed by a {...} block. The
+    brace search starts after the comment line, so glyphs such as '{' and '}'
+    do not confuse it, and the blocks are never nested. Only the small
+    per-glyph pieces are copied out of `content` and decoded.
+    """
+    pos = start
+    while True:
+        comment = content.find(b"// 0x", pos, end)
+        if comment < 0:
+            return
+        line_end = content.find(b"\n", comment, end)
+        block_start = content.find(b"{", line_end, end)
+        block_end = content.find(b"}", block_start, end)
+        if line_end < 0 or block_start < 0 or block_end < 0:
+            return
+
+        # "0xNN 'c'" -> hex digits and the quoted character
+        hex_digits, _, quoted = content[comment + 5 : line_end].partition(b" ")
+        char_display = quoted.strip()[1:-1].decode("utf-8")
+        byte_data_str = content[block_start + 1 : block_end].decode("ascii")
+        yield int(hex_digits, 16), char_display, byte_data_str
+        pos = block_end + 1
+
 
 def parse_font_header(header_path):
     """
@@ -24,9 +96,22 @@ def parse_font_header(header_path):
     Returns:
         dict with 'width', 'height', 'chars' (list of char dicts)
     """
-    with open(header_path, "r") as f:
-        content = f.read()
+    # Map the file instead of reading it into a str: full-range headers run
+    # to several MB, and only the small per-glyph pieces are ever copied
+    with open(header_path, "rb") as f, mmap.mmap(
+        f.fileno(), 0, access=mmap.ACCESS_READ
+    ) as content:
+        return parse_font_content(content)
 
+
+def parse_font_content(content):
+    """
+    Parse font header contents (bytes or a memory map).
+
+    Returns:
+        dict with 'width', 'height', 'characters' (list of char dicts) and
+        'by_cp' (the same char dicts keyed by codepoint)
+    """
     # Extract metadata from comments
     width = None
     height = None
@@ -35,48 +120,32 @@ def parse_font_header(header_path):
     font_name = None
 
     # Look for size info: "Size: 16x16 pixels"
-    size_match = re.search(r"Size:\s*(\d+)x(\d+)\s*pixels", content)
+    size_match = SIZE_PATTERN.search(content)
     if size_match:
         width = int(size_match.group(1))
         height = int(size_match.group(2))
 
     # Look for character range: "Characters: 0x20..0x7E"
-    range_match = re.search(
-        r"Characters:\s*0x([0-9A-Fa-f]+)\.\.0x([0-9A-Fa-f]+)", content
-    )
+    range_match = RANGE_PATTERN.search(content)
     if range_match:
         char_start = int(range_match.group(1), 16)
         char_end = int(range_match.group(2), 16)
 
-    # Extract font array name
-    array_match = re.search(r"static const uint8_t\s+(\w+)_data\[", content)
-    if array_match:
-        font_name = array_match.group(1)
+    # Extract font array name and the bounds of its definition
+    font_name, body_start, body_end = find_font_array(content)
 
     if not all([width, height, char_start, char_end, font_name]):
         raise ValueError("Could not extract all font metadata from header file")
 
-    # Extract character data
-    # Find the array definition
-    array_pattern = rf"{font_name}_data\[.*?\]\[.*?\]\s*=\s*\{{(.*?)\}};"
-    array_match = re.search(array_pattern, content, re.DOTALL)
-    if not array_match:
-        raise ValueError(f"Could not find {font_name}_data array")
-
-    array_content = array_match.group(1)
-
     # Parse each character
     characters = []
-    char_pattern = r"// 0x([0-9A-Fa-f]+)\s+\'(.*?)\'\s*\n\s*\{(.*?)\}"
 
-    for match in re.finditer(char_pattern, array_content, re.DOTALL):
-        codepoint = int(match.group(1), 16)
-        char_display = match.group(2)
-        byte_data_str = match.group(3)
-
-        # Extract hex values
-        hex_values = re.findall(r"0x([0-9A-Fa-f]+)", byte_data_str)
-        byte_data = [int(val, 16) for val in hex_values]
+    for codepoint, char_display, byte_data_str in iter_glyph_entries(
+        content, body_start, body_end
+    ):
+        # Decode "0x12, 0x34, ..." in one bytes.fromhex() call, which
+        # skips the whitespace left behind by the removed separators
+        byte_data = bytes.fromhex(byte_data_str.replace("0x", "").replace(",", " "))
 
         # Determine actual character
         if char_display.startswith("\\"):
@@ -109,7 +178,78 @@ def parse_font_header(header_path):
         "char_start": char_start,
         "char_end": char_end,
         "characters": characters,
+        "by_cp": index_by_codepoint(characters),
+    }
+
+
+def index_by_codepoint(characters):
+    """Map codepoint -> char dict for lookups."""
+    # Reversed so the first of any duplicate entries wins, as with a linear
+    # search
+    return {char["codepoint"]: char for char in reversed(characters)}
+
+
+def row_to_ascii(row_bytes, width):
+    """Render one row of glyph bytes (MSB = leftmost pixel) as ASCII art."""
+    # format() and translate() build the whole row in C, one call each
+    row_value = int.from_bytes(row_bytes, "big")
+    return format(row_value, f"0{width}b")[-width:].translate(PIXEL_CHARS)
+
+
+def load_font_header(header_path, use_cache=False):
+    """
+    Parse a font header, optionally reusing a cached parse.
+
+    The cache is a JSON file beside the header holding the glyph bytes as
+    hex, keyed on the header's size and modification time. JSON rather than
+    pickle, so reading a foreign or tampered cache file cannot run code. A
+    missing, stale or malformed cache falls back to parsing, and a cache that
+    cannot be written is skipped silently.
+    """
+    header_path = Path(header_path)
+    if not use_cache:
+        return parse_font_header(header_path)
+
+    cache_path = header_path.with_name(header_path.name + ".cache.json")
+    stat = header_path.stat()
+    key = [CACHE_VERSION, stat.st_mtime_ns, stat.st_size]
+
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+        if cached["key"] == key:
+            characters = [
+                {"codepoint": codepoint, "char": char, "bytes": bytes.fromhex(hex_data)}
+                for codepoint, char, hex_data in cached["characters"]
+            ]
+            font_data = dict(cached["font"])
+            font_data["characters"] = characters
+            font_data["by_cp"] = index_by_codepoint(characters)
+            return font_data
+    except Exception:
+        # Any unreadable or malformed cache is simply re-parsed
+        pass
+
+    font_data = parse_font_header(header_path)
+
+    cached = {
+        "key": key,
+        "font": {
+            field: font_data[field]
+            for field in ("name", "width", "height", "char_start", "char_end")
+        },
+        "characters": [
+            [char["codepoint"], char["char"], char["bytes"].hex()]
+            for char in font_data["characters"]
+        ],
     }
+    try:
+        with open(cache_path, "w", encoding="utf-8") as f:
+            json.dump(cached, f)
+    except OSError:
+        pass
+
+    return font_data
 
 
 def visualize_character(char_data, width, height):
@@ -131,29 +271,12 @@ def visualize_character(char_data, width, height):
     for row in range(height):
         row_start = row * bytes_per_row
         row_end = row_start + bytes_per_row
-        row_bytes = byte_data[row_start:row_end]
-
-        # Reconstruct row value
-        row_value = 0
-        for i, byte_val in enumerate(row_bytes):
-            shift = (bytes_per_row - 1 - i) * 8
-            row_value |= byte_val << shift
-
-        # Convert to ASCII art
-        line = ""
-        for x in range(width):
-            bit_position = width - 1 - x
-            if row_value & (1 << bit_position):
-                line += "█"  # Full block
-            else:
-                line += "·"  # Middle dot for empty
-
-        lines.append(line)
+        lines.append(row_to_ascii(byte_data[row_start:row_end], width))
 
     return "\n".join(lines)
 
 
-def test_font_file(header_path, show_char=None, show_all=False):
+def test_font_file(header_path, show_char=None, show_all=False, use_cache=False):
     """
     Test and visualize a font file.
 
@@ -161,6 +284,8 @@ def test_font_file(header_path, show_char=None, show_all=False):
         header_path: Path to header file
         show_char: Specific character to display (or None)
         show_all: Show all characters
+        use_cache: Save the parse beside the header and reuse it while the
+            header is unchanged
     """
     print("=" * 60)
     print("Font Header Test")
@@ -169,7 +294,7 @@ def test_font_file(header_path, show_char=None, show_all=False):
     print()
 
     try:
-        font_data = parse_font_header(header_path)
+        font_data = load_font_header(header_path, use_cache)
     except Exception as e:
         print(f"ERROR: Failed to parse font file: {e}")
         return 1
@@ -241,17 +366,9 @@ def test_font_file(header_path, show_char=None, show_all=False):
         # Find specific character
         char_to_show = None
         if show_char.startswith("0x"):
-            search_cp = int(show_char, 16)
-            for char in font_data["characters"]:
-                if char["codepoint"] == search_cp:
-                    char_to_show = char
-                    break
+            char_to_show = font_data["by_cp"].get(int(show_char, 16))
         elif len(show_char) == 1:
-            search_cp = ord(show_char)
-            for char in font_data["characters"]:
-                if char["codepoint"] == search_cp:
-                    char_to_show = char
-                    break
+            char_to_show = font_data["by_cp"].get(ord(show_char))
 
         if char_to_show:
             print(
@@ -283,27 +400,17 @@ def test_font_file(header_path, show_char=None, show_all=False):
 
             # Print characters side by side (if not too wide)
             if font_data["width"] * len(group) < 70:
+                width = font_data["width"]
+                bytes_per_row = (width + 7) // 8
                 for row in range(font_data["height"]):
-                    row_str = ""
-                    for char in group:
-                        bytes_per_row = (font_data["width"] + 7) // 8
-                        row_start = row * bytes_per_row
-                        row_end = row_start + bytes_per_row
-                        row_bytes = char["bytes"][row_start:row_end]
-
-                        row_value = 0
-                        for j, byte_val in enumerate(row_bytes):
-                            shift = (bytes_per_row - 1 - j) * 8
-                            row_value |= byte_val << shift
-
-                        for x in range(font_data["width"]):
-                            bit_position = font_data["width"] - 1 - x
-                            if row_value & (1 << bit_position):
-                                row_str += "█"
-                            else:
-                                row_str += "·"
-                        row_str += " "
-                    print(row_str)
+                    row_start = row * bytes_per_row
+                    row_end = row_start + bytes_per_row
+                    print(
+                        "".join(
+                            row_to_ascii(char["bytes"][row_start:row_end], width) + " "
+                            for char in group
+                        )
+                    )
             else:
                 # Too wide, print vertically
                 for char in group:
@@ -321,16 +428,10 @@ def test_font_file(header_path, show_char=None, show_all=False):
 
         sample_chars = ["A", "g", "0", "5", "!", "@"]
         for sample in sample_chars:
-            sample_cp = ord(sample)
-            for char in font_data["characters"]:
-                if char["codepoint"] == sample_cp:
-                    print(f"\n'{char['char']}' (0x{char['codepoint']:02X}):")
-                    print(
-                        visualize_character(
-                            char, font_data["width"], font_data["height"]
-                        )
-                    )
-                    break
+            char = font_data["by_cp"].get(ord(sample))
+            if char:
+                print(f"\n'{char['char']}' (0x{char['codepoint']:02X}):")
+                print(visualize_character(char, font_data["width"], font_data["height"]))
 
     print()
     print("=" * 60)
@@ -360,6 +461,11 @@ Examples:
     parser.add_argument(
         "--all", "-a", action="store_true", help="Display all characters"
     )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Cache the parsed header in a .cache.json file beside it",
+    )
 
     args = parser.parse_args()
 
@@ -370,7 +476,7 @@ Examples:
         return 1
 
     # Run test
-    return test_font_file(header_path, args.char, args.all)
+    return test_font_file(header_path, args.char, args.all, args.cache)
 
 
 if __name__ == "__main__":
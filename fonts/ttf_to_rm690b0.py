@@ -13,6 +13,8 @@ rm690b0 format:
 
 Requirements:
     pip install Pillow
+    pip install fonttools  (optional: codepoints the font does not define are
+                            emitted as blank glyphs without rendering them)
 
 Usage:
     python ttf_to_rm690b0.py input.ttf --width 16 --height 16 --output font_16x16.h
@@ -22,6 +24,7 @@ Usage:
 
 import argparse
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 try:
@@ -30,8 +33,44 @@ except ImportError:
     print("ERROR: Pillow library is required. Install with: pip install Pillow")
     sys.exit(1)
 
+try:
+    from fontTools.ttLib import TTFont
+except ImportError:
+    TTFont = None
+
+# Grayscale -> 1-bit threshold table (foreground above middle gray)
+THRESHOLD_LUT = [255 if value > 128 else 0 for value in range(256)]
+
+# Byte value -> its 8 pixels as ASCII art (MSB first), for visualize_character
+BYTE_TO_ASCII = [
+    "".join("#" if value & (0x80 >> bit) else "." for bit in range(8))
+    for value in range(256)
+]
+
+
+def font_codepoints(ttf_path):
+    """
+    Return the codepoints the font maps to glyphs, or None if unknown.
+
+    Needs fontTools; without it, or if the cmap cannot be read, every
+    codepoint is rendered.
+    """
+    if TTFont is None:
+        return None
+    try:
+        with TTFont(str(ttf_path), lazy=True) as ttf:
+            return set(ttf.getBestCmap() or ())
+    except Exception:
+        return None
+
+
+def new_canvas(width, height):
+    """Create an (image, draw) pair that render_character() can reuse."""
+    img = Image.new("L", (width, height), 0)
+    return img, ImageDraw.Draw(img)
 
-def render_character(font, char, width, height, baseline_offset=0):
+
+def render_character(font, char, width, height, baseline_offset=0, canvas=None):
     """
     Render a single character to a bitmap.
 
@@ -41,13 +80,18 @@ def render_character(font, char, width, height, baseline_offset=0):
         width: Target width in pixels
         height: Target height in pixels
         baseline_offset: Vertical offset for baseline adjustment
+        canvas: (image, draw) pair from new_canvas() to render into, cleared
+            first; a new one is created if omitted
 
     Returns:
-        List of integers representing rows (width bits per row)
+        bytes in rm690b0 row format (height rows of (width + 7) // 8 bytes)
     """
-    # Create image with target size
-    img = Image.new("L", (width, height), 0)
-    draw = ImageDraw.Draw(img)
+    if canvas is None:
+        img, draw = new_canvas(width, height)
+    else:
+        # Reuse the caller's image instead of allocating one per glyph
+        img, draw = canvas
+        draw.rectangle((0, 0, width, height), fill=0)
 
     # Get font metrics
     ascent, descent = font.getmetrics()
@@ -69,46 +113,39 @@ def render_character(font, char, width, height, baseline_offset=0):
     # Draw the character
     draw.text((x_offset, y_offset), char, font=font, fill=255)
 
-    # Convert to bitmap rows
-    rows = []
-    pixels = img.load()
+    # Threshold and pack in Pillow's C code: a mode "1" image serializes as
+    # MSB-first bits, one row after another
+    bitmap = img.point(THRESHOLD_LUT, "1")
+    bytes_per_row = (width + 7) // 8  # Round up to nearest byte
+    padding = bytes_per_row * 8 - width
 
-    for y in range(height):
-        row_value = 0
-        for x in range(width):
-            pixel = pixels[x, y]
-            # Threshold at 128 (middle gray)
-            if pixel > 128:
-                # Set bit: MSB = leftmost pixel
-                bit_position = width - 1 - x
-                row_value |= 1 << bit_position
-        rows.append(row_value)
+    if padding:
+        # Pillow pads each row on the right, but the font format keeps the
+        # unused bits at the top of the first byte (the row value is
+        # right-aligned), so widen the image on the left to a whole number of
+        # bytes first; crop() fills the area outside the source with 0
+        bitmap = bitmap.crop((-padding, 0, width, height))
 
-    return rows
+    return bitmap.tobytes()
 
 
-def rows_to_bytes(rows, width):
-    """
-    Convert row values to byte array.
+# Per-process state for parallel rendering: PIL font objects cannot be sent
+# between processes, so each worker loads the TTF once in _init_worker()
+_worker_font = None
+_worker_args = None
 
-    Args:
-        rows: List of row values (integers)
-        width: Width in pixels
 
-    Returns:
-        List of bytes
-    """
-    bytes_per_row = (width + 7) // 8  # Round up to nearest byte
-    result = []
+def _init_worker(ttf_path, font_size, width, height, baseline_offset):
+    global _worker_font, _worker_args
+    _worker_font = ImageFont.truetype(ttf_path, font_size)
+    _worker_args = (width, height, baseline_offset, new_canvas(width, height))
 
-    for row_value in rows:
-        # Split row into bytes (MSB first)
-        for byte_idx in range(bytes_per_row):
-            shift = (bytes_per_row - 1 - byte_idx) * 8
-            byte_val = (row_value >> shift) & 0xFF
-            result.append(byte_val)
 
-    return result
+def _render_codepoint(codepoint):
+    width, height, baseline_offset, canvas = _worker_args
+    return render_character(
+        _worker_font, chr(codepoint), width, height, baseline_offset, canvas
+    )
 
 
 def convert_ttf_to_rm690b0(
@@ -119,6 +156,7 @@ def convert_ttf_to_rm690b0(
     end_char=0x7E,
     font_size=None,
     baseline_offset=0,
+    jobs=1,
 ):
     """
     Convert TTF font to rm690b0 format.
@@ -131,6 +169,7 @@ def convert_ttf_to_rm690b0(
         end_char: Last character code (default: 0x7E = ~)
         font_size: TTF font size in points (default: height)
         baseline_offset: Vertical offset adjustment
+        jobs: Worker processes for rendering (default: 1, render in-process)
 
     Returns:
         List of character dictionaries with bitmap data
@@ -145,22 +184,64 @@ def convert_ttf_to_rm690b0(
         sys.exit(1)
 
     characters = []
+    codepoints = range(start_char, end_char + 1)
+
+    # Codepoints missing from the font's cmap would only render its .notdef
+    # box, so they are not rendered at all and get a blank glyph instead
+    defined = font_codepoints(ttf_path)
+    if defined is None:
+        to_render = codepoints
+    else:
+        to_render = [codepoint for codepoint in codepoints if codepoint in defined]
+        skipped = len(codepoints) - len(to_render)
+        if skipped:
+            print(f"Skipping {skipped} characters not defined in the font")
+    blank_glyph = bytes(((width + 7) // 8) * height)
+
+    def with_blanks(rendered):
+        # Undefined codepoints keep their slot in the array, so indexing by
+        # codepoint - start_char still works
+        rendered = iter(rendered)
+        for codepoint in codepoints:
+            if defined is None or codepoint in defined:
+                yield next(rendered)
+            else:
+                yield blank_glyph
 
-    for codepoint in range(start_char, end_char + 1):
-        char = chr(codepoint)
-
-        # Render character
-        rows = render_character(font, char, width, height, baseline_offset)
-
-        # Convert to bytes
-        byte_data = rows_to_bytes(rows, width)
-
-        characters.append({"codepoint": codepoint, "char": char, "bytes": byte_data})
+    def collect(glyphs):
+        # Glyphs arrive in codepoint order from either rendering path
+        for codepoint, byte_data in zip(codepoints, glyphs):
+            characters.append(
+                {"codepoint": codepoint, "char": chr(codepoint), "bytes": byte_data}
+            )
 
-        if codepoint % 16 == 0:
-            print(
-                f"Processed {codepoint - start_char + 1}/{end_char - start_char + 1} characters..."
+            if codepoint % 16 == 0:
+                print(
+                    f"Processed {codepoint - start_char + 1}/{end_char - start_char + 1} characters..."
+                )
+
+    if jobs > 1:
+        # Glyphs are independent, so large ranges fan out across processes
+        with ProcessPoolExecutor(
+            max_workers=jobs,
+            initializer=_init_worker,
+            initargs=(str(ttf_path), font_size, width, height, baseline_offset),
+        ) as executor:
+            collect(
+                with_blanks(executor.map(_render_codepoint, to_render, chunksize=16))
             )
+    else:
+        # Render each character straight to packed row bytes, all into one
+        # reused canvas
+        canvas = new_canvas(width, height)
+        collect(
+            with_blanks(
+                render_character(
+                    font, chr(codepoint), width, height, baseline_offset, canvas
+                )
+                for codepoint in to_render
+            )
+        )
 
     print(f"Processed all {len(characters)} characters")
     return characters
@@ -183,73 +264,62 @@ def generate_header_file(
     """
     bytes_per_char = len(characters[0]["bytes"])
     bytes_per_row = (width + 7) // 8
+    last_cp = characters[-1]["codepoint"]
+
+    # Build the whole file in memory and write it in one call
+    parts = [
+        "#pragma once\n\n",
+        "#include <stdint.h>\n\n",
+        f"// Font: {ttf_source}\n",
+        f"// Size: {width}x{height} pixels\n",
+        f"// Characters: 0x{start_char:02X}..0x{last_cp:02X} ",
+        f"('{chr(start_char)}'..'{characters[-1]['char']}')\n",
+        f"// Each character: {bytes_per_char} bytes ({height} rows × {bytes_per_row} bytes per row)\n",
+        f"// Each row: {bytes_per_row} byte(s) for {width} pixels, MSB = leftmost pixel\n",
+        f"// Indexing: glyph = {font_name}_data[codepoint - 0x{start_char:02X}] ",
+        f"for 0x{start_char:02X} <= codepoint <= 0x{last_cp:02X}\n",
+        "//\n",
+        "// Generated by ttf_to_rm690b0.py\n\n",
+        f"static const uint8_t {font_name}_data[{len(characters)}][{bytes_per_char}] = {{\n",
+    ]
+
+    for char_info in characters:
+        cp = char_info["codepoint"]
+        ch = char_info["char"]
+
+        # Escape special characters in comments
+        if ch == "\\":
+            ch_display = "\\\\"
+        elif ch == "'":
+            ch_display = "\\'"
+        elif ch == '"':
+            ch_display = '\\"'
+        elif ch == "\n":
+            ch_display = "\\n"
+        elif ch == "\r":
+            ch_display = "\\r"
+        elif ch == "\t":
+            ch_display = "\\t"
+        elif ord(ch) < 32 or ord(ch) > 126:
+            ch_display = f"\\x{ord(ch):02X}"
+        else:
+            ch_display = ch
 
-    with open(output_path, "w") as f:
-        f.write("#pragma once\n\n")
-        f.write("#include <stdint.h>\n\n")
-        f.write(f"// Font: {ttf_source}\n")
-        f.write(f"// Size: {width}x{height} pixels\n")
-        f.write(
-            f"// Characters: 0x{start_char:02X}..0x{characters[-1]['codepoint']:02X} "
-        )
-        f.write(f"('{chr(start_char)}'..'{characters[-1]['char']}')\n")
-        f.write(
-            f"// Each character: {bytes_per_char} bytes ({height} rows × {bytes_per_row} bytes per row)\n"
-        )
-        f.write(
-            f"// Each row: {bytes_per_row} byte(s) for {width} pixels, MSB = leftmost pixel\n"
-        )
-        f.write(
-            f"// Indexing: glyph = {font_name}_data[codepoint - 0x{start_char:02X}] "
-        )
-        f.write(
-            f"for 0x{start_char:02X} <= codepoint <= 0x{characters[-1]['codepoint']:02X}\n"
-        )
-        f.write("//\n")
-        f.write("// Generated by ttf_to_rm690b0.py\n\n")
-
-        f.write(
-            f"static const uint8_t {font_name}_data[{len(characters)}][{bytes_per_char}] = {{\n"
-        )
-
-        for char_info in characters:
-            cp = char_info["codepoint"]
-            ch = char_info["char"]
-
-            # Escape special characters in comments
-            if ch == "\\":
-                ch_display = "\\\\"
-            elif ch == "'":
-                ch_display = "\\'"
-            elif ch == '"':
-                ch_display = '\\"'
-            elif ch == "\n":
-                ch_display = "\\n"
-            elif ch == "\r":
-                ch_display = "\\r"
-            elif ch == "\t":
-                ch_display = "\\t"
-            elif ord(ch) < 32 or ord(ch) > 126:
-                ch_display = f"\\x{ord(ch):02X}"
-            else:
-                ch_display = ch
-
-            f.write(f"    // 0x{cp:02X} '{ch_display}'\n")
-            f.write("    {")
-
-            bytes_data = char_info["bytes"]
-            for i, byte_val in enumerate(bytes_data):
-                if i > 0:
-                    f.write(",")
-                if i % 16 == 0:
-                    f.write("\n     ")
-                else:
-                    f.write(" ")
-                f.write(f"0x{byte_val:02X}")
+        # 16 values per line: "0x00, 0x01, ..." with lines joined by ",\n";
+        # bytes.hex() formats each line in C, then the separators become
+        # C literal prefixes
+        bytes_data = char_info["bytes"]
+        lines = [
+            "0x" + bytes_data[i : i + 16].hex(" ").upper().replace(" ", ", 0x")
+            for i in range(0, len(bytes_data), 16)
+        ]
+        parts.append(f"    // 0x{cp:02X} '{ch_display}'\n")
+        parts.append("    {\n     " + ",\n     ".join(lines) + "\n    },\n")
 
-            f.write("\n    },\n")
+    parts.append("};\n")
 
-        f.write("};\n")
+    with open(output_path, "w") as f:
+        f.write("".join(parts))
 
 
 def visualize_character(char_data, width, height):
@@ -269,23 +339,12 @@ def visualize_character(char_data, width, height):
 
     lines = []
     for row in range(height):
-        line = ""
         row_bytes = byte_data[row * bytes_per_row : (row + 1) * bytes_per_row]
 
-        # Reconstruct row value
-        row_value = 0
-        for i, byte_val in enumerate(row_bytes):
-            row_value |= byte_val << ((bytes_per_row - 1 - i) * 8)
-
-        # Convert to ASCII art
-        for x in range(width):
-            bit_position = width - 1 - x
-            if row_value & (1 << bit_position):
-                line += "#"
-            else:
-                line += "."
-
-        lines.append(line)
+        # One table lookup per byte; rows are right-aligned, so the unused
+        # padding bits are the leading ones and the last `width` chars remain
+        line = "".join([BYTE_TO_ASCII[byte_val] for byte_val in row_bytes])
+        lines.append(line[-width:])
 
     return "\n".join(lines)
 
@@ -345,6 +404,13 @@ Examples:
         default=0,
         help="Baseline offset adjustment (default: 0)",
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes for rendering large ranges (default: 1)",
+    )
     parser.add_argument(
         "--preview",
         type=str,
@@ -371,6 +437,10 @@ Examples:
         print("ERROR: End character code must be >= start code")
         sys.exit(1)
 
+    if args.jobs < 1:
+        print("ERROR: Jobs must be at least 1")
+        sys.exit(1)
+
     # Generate font name if not specified
     if args.name is None:
         args.name = f"rm690b0_font_{args.width}x{args.height}"
@@ -407,6 +477,7 @@ Examples:
         args.end,
         args.size,
         args.baseline,
+        args.jobs,
     )
 
     # Preview character if requested